@@ -185,6 +185,14 @@ def package_versions(
     multiple=True,
     default=(),
 )
+@click.option(
+    "-j",
+    "--jobs",
+    help="Number of worker processes to use for linting files in directories.",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+)
 @click.argument(
     "target", type=click.Path(file_okay=True, dir_okay=True, exists=True), nargs=-1
 )
@@ -196,6 +204,7 @@ def inventory_lint(
     target: tuple[str, ...],
     linter: tuple[str, ...],
     ignore_patterns: tuple[str, ...],
+    jobs: int,
 ):
     """Lint YAML files in the provided paths.
 
@@ -219,7 +228,9 @@ def inventory_lint(
     for t in target:
         lint_target = Path(t)
         for lint in linter:
-            error_counts.append(LINTERS[lint](config, lint_target, ignore_patterns))
+            error_counts.append(
+                LINTERS[lint](config, lint_target, ignore_patterns, jobs=jobs)
+            )
 
     errors = sum(error_counts)
     exit_status = 0 if errors == 0 else 1
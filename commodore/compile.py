@@ -218,9 +218,9 @@ def setup_compile_environment(config: Config) -> tuple[dict[str, Any], Iterable[
     check_parameters_component_versions(cluster_parameters)
     create_component_library_aliases(config, cluster_parameters)
 
-    # Verify that all aliased components support instantiation
-    config.verify_component_aliases(cluster_parameters)
-    config.register_component_deprecations(cluster_parameters)
+    # Verify that all aliased components support instantiation and register
+    # deprecation notices for deprecated components
+    config.check_component_metadata(cluster_parameters)
     # Raise exception if component version override without URL is present in the
     # hierarchy.
     verify_version_overrides(cluster_parameters)
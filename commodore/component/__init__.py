@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import functools
+
 from collections.abc import Iterable
 from pathlib import Path as P
 from typing import Optional
@@ -201,5 +203,6 @@ def component_dir(work_dir: P, name: str) -> P:
     return work_dir / "dependencies" / name
 
 
+@functools.lru_cache(maxsize=512)
 def component_parameters_key(name: str) -> str:
     return name.replace("-", "_")
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import configparser
+
 from pathlib import Path
 from shutil import rmtree
+from typing import Optional
 
 import click
 import git
@@ -13,6 +16,51 @@ from commodore.dependency_templater import Templater
 from commodore.multi_dependency import MultiDependency
 
 
+def _read_origin_url_from_config(cdir: Path) -> Optional[str]:
+    """Read URL of remote `origin` of the repo checked out in `cdir` directly from the
+    repo's git config.
+
+    Returns `None` if the URL can't be determined unambiguously with this simple
+    parser, e.g. if the config uses includes, or if the value is quoted, escaped or
+    has an inline comment."""
+    gitdir = cdir / ".git"
+    if gitdir.is_file():
+        # Worktree checkouts have a `.git` file which points to the worktree's
+        # gitdir. The worktree's gitdir in turn points to the repo's common
+        # gitdir which holds the config.
+        key, _, gitdir_ref = gitdir.read_text(encoding="utf-8").strip().partition(": ")
+        if key != "gitdir" or not gitdir_ref:
+            return None
+        gitdir = cdir / gitdir_ref
+        commondir = gitdir / "commondir"
+        if commondir.is_file():
+            gitdir = gitdir / commondir.read_text(encoding="utf-8").strip()
+    gitcfg = (gitdir / "config").read_text(encoding="utf-8")
+    # Git config entries are usually indented, which `configparser` would treat as
+    # continuation lines. We use strict mode, so that repeated sections or keys raise
+    # an error instead of being merged.
+    parser = configparser.ConfigParser(interpolation=None)
+    parser.read_string("\n".join(line.strip() for line in gitcfg.splitlines()))
+    if any(section.lower().startswith("include") for section in parser.sections()):
+        return None
+    url = parser['remote "origin"'].get("url")
+    if not url or any(c in url for c in '"\\;#'):
+        return None
+    return url
+
+
+def _read_remote_url(cdir: Path) -> str:
+    """Read URL of remote `origin` of the repo checked out in `cdir`. Falls back to
+    asking git if the URL can't be read directly from the repo's git config."""
+    try:
+        url = _read_origin_url_from_config(cdir)
+    except (KeyError, OSError, configparser.Error):
+        url = None
+    if url is None:
+        url = git.Repo(cdir).git.config("--get", "remote.origin.url")
+    return url
+
+
 class ComponentTemplater(Templater):
     library: bool
     post_process: bool
@@ -112,20 +160,20 @@ class ComponentTemplater(Templater):
     def delete(self):
         cdir = component_dir(self.config.work_dir, self.slug)
         if cdir.exists():
-            cr = git.Repo(cdir)
-            cdep = MultiDependency(
-                cr.remote().url, self.config.inventory.dependencies_dir
-            )
-            component = Component(
-                self.slug, dependency=cdep, work_dir=self.config.work_dir
-            )
-
             if not self.config.force:
                 click.confirm(
                     "Are you sure you want to delete component "
                     f"{self.slug}? This action cannot be undone",
                     abort=True,
                 )
+
+            # Only inspect the component repo once the user has confirmed the deletion
+            remote_url = _read_remote_url(cdir)
+            cdep = MultiDependency(remote_url, self.config.inventory.dependencies_dir)
+            component = Component(
+                self.slug, dependency=cdep, work_dir=self.config.work_dir
+            )
+
             rmtree(component.target_directory)
             # We check for other checkouts here, because our MultiDependency doesn't
             # know if there's other dependencies which would be registered on it.
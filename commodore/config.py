@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import functools
 import json
+import re
 import time
 import textwrap
 
@@ -9,7 +11,6 @@ from pathlib import Path as P
 from typing import Any, Iterable, Optional
 
 import click
-import jwt
 import requests
 
 from url_normalize import url_normalize
@@ -21,6 +22,19 @@ from .multi_dependency import MultiDependency, dependency_key
 from .package import Package
 from . import tokencache
 
+_NOTICE_WRAPPER = textwrap.TextWrapper(
+    width=100,
+    # Next two options ensure we don't break URLs
+    break_long_words=False,
+    break_on_hyphens=False,
+    initial_indent=" > ",
+    subsequent_indent="   ",
+)
+
+
+# Matches nested keys of the form `path.to.key` which don't contain empty segments
+_NESTED_KEY_RE = re.compile(r"[^.]+(?:\.[^.]+)*")
+
 
 class Migration(Enum):
     KAP_029_030 = "kapitan-0.29-to-0.30"
@@ -28,13 +42,14 @@ class Migration(Enum):
 
 # pylint: disable=too-many-instance-attributes,too-many-public-methods
 class Config:
-    _inventory: Inventory
     _components: dict[str, Component]
     _config_repos: dict[str, GitRepo]
     _component_aliases: dict[str, str]
     _packages: dict[str, Package]
     _dependency_repos: dict[str, MultiDependency]
-    _deprecation_notices: list[str]
+    _inventory_cache: dict[bool, dict]
+    # Insertion-ordered set of registered deprecation notices
+    _deprecation_notices: dict[str, None]
     _migration: Optional[Migration]
     _dynamic_facts: dict[str, Any]
     _github_token: Optional[str]
@@ -70,8 +85,8 @@ class Config:
         self.interactive = None
         self.force = False
         self._fetch_dependencies = True
-        self._inventory = Inventory(work_dir=self.work_dir)
-        self._deprecation_notices = []
+        self._inventory_cache = {}
+        self._deprecation_notices = {}
         self._global_repo_revision_override = None
         self._tenant_repo_revision_override = None
         self._migration = None
@@ -92,7 +107,7 @@ class Config:
 
     @property
     def config_file(self):
-        return self._inventory.global_config_dir / "commodore.yml"
+        return self.inventory.global_config_dir / "commodore.yml"
 
     @property
     def jsonnet_file(self) -> P:
@@ -105,7 +120,9 @@ class Config:
     @work_dir.setter
     def work_dir(self, d: P):
         self._work_dir = d
-        self.inventory.work_dir = d
+        # Only update the inventory object if it's already been created
+        if "inventory" in self.__dict__:
+            self.inventory.work_dir = d
 
     @property
     def vendor_dir(self) -> P:
@@ -141,15 +158,13 @@ class Config:
             tokens = tokencache.get(self.api_url)
             token = tokens.get("id_token")
             if token is not None:
-                # We don't verify the signature, we just want to know if the token is expired
-                # lieutenant will decide if it's valid
-                try:
-                    t = jwt.decode(
-                        token, algorithms=["RS256"], options={"verify_signature": False}
-                    )
-                    if "exp" in t and t["exp"] < time.time() + 10:
-                        return None
-                except jwt.exceptions.InvalidTokenError:
+                # We don't verify the signature, we just want to know if the token is
+                # expired, lieutenant will decide if it's valid
+                claims = tokencache.peek_claims(token)
+                if claims is None:
+                    return None
+                exp = claims.get("exp")
+                if exp is not None and exp < time.time() + 10:
                     return None
                 self._api_token = token
         return self._api_token
@@ -157,6 +172,10 @@ class Config:
     @api_token.setter
     def api_token(self, api_token):
         if api_token is not None:
+            if _looks_like_api_token(api_token):
+                # Skip probing the file system for values which are obviously tokens
+                self._api_token = api_token.strip()
+                return
             try:
                 p = P(api_token)
                 if p.is_file():
@@ -214,9 +233,24 @@ class Config:
     def github_token(self, github_token: str):
         self._github_token = github_token
 
+    @functools.cached_property
+    def inventory(self) -> Inventory:
+        return Inventory(work_dir=self.work_dir)
+
     @property
-    def inventory(self):
-        return self._inventory
+    def inventory_cache(self) -> dict[bool, dict]:
+        """Rendered Kapitan inventories, keyed by the value of `ignore_class_notfound`
+        used for rendering.
+
+        The cache is populated by `kapitan_inventory(..., cached=True)`."""
+        return self._inventory_cache
+
+    def invalidate_inventory_cache(self):
+        """Drop all cached rendered inventories.
+
+        Must be called after making changes to the inventory before using
+        `kapitan_inventory(..., cached=True)` again."""
+        self._inventory_cache = {}
 
     def update_verbosity(self, verbose):
         self._verbose += verbose
@@ -268,35 +302,61 @@ class Config:
         self._component_aliases = aliases
 
     def verify_component_aliases(self, cluster_parameters: dict):
-        for alias, cn in self._component_aliases.items():
-            if alias != cn and not _component_is_aliasable(cluster_parameters, cn):
-                raise click.ClickException(
-                    f"Component {cn} with alias {alias} does not support instantiation."
-                )
+        self._scan_component_metadata(cluster_parameters, register_deprecations=False)
 
     def register_deprecation_notice(self, notice: str):
-        self._deprecation_notices.append(notice)
+        # Notices which are already registered, e.g. when the inventory is checked
+        # multiple times, keep their original position.
+        self._deprecation_notices[notice] = None
 
     def print_deprecation_notices(self):
-        tw = textwrap.TextWrapper(
-            width=100,
-            # Next two options ensure we don't break URLs
-            break_long_words=False,
-            break_on_hyphens=False,
-            initial_indent=" > ",
-            subsequent_indent="   ",
-        )
         if len(self._deprecation_notices) > 0:
             click.secho("\nCommodore notices:", bold=True)
             for notice in self._deprecation_notices:
-                notice = tw.fill(notice)
+                notice = _NOTICE_WRAPPER.fill(notice)
                 click.secho(notice)
 
     def register_component_deprecations(self, cluster_parameters):
-        for cname in self._component_aliases.values():
-            ckey = component_parameters_key(cname)
-            cmeta = cluster_parameters[ckey].get("_metadata", {})
+        self._scan_component_metadata(cluster_parameters, verify_aliases=False)
+
+    def check_component_metadata(self, cluster_parameters: dict):
+        """Verify that all aliased components support instantiation and register
+        deprecation notices for deprecated components in a single pass over the
+        components' metadata."""
+        self._scan_component_metadata(cluster_parameters)
 
+    def _scan_component_metadata(
+        self,
+        cluster_parameters: dict,
+        verify_aliases: bool = True,
+        register_deprecations: bool = True,
+    ):
+        # Multiple aliases can refer to the same component, look up each component's
+        # metadata only once.
+        cmetas: dict[str, dict] = {}
+
+        def _metadata(cn: str) -> dict:
+            if cn not in cmetas:
+                ckey = component_parameters_key(cn)
+                cmetas[cn] = cluster_parameters[ckey].get("_metadata", {})
+            return cmetas[cn]
+
+        for alias, cn in self._component_aliases.items():
+            if register_deprecations:
+                _metadata(cn)
+            if (
+                verify_aliases
+                and alias != cn
+                and not _metadata(cn).get("multi_instance", False)
+            ):
+                raise click.ClickException(
+                    f"Component {cn} with alias {alias} does not support instantiation."
+                )
+
+        if not register_deprecations:
+            return
+
+        for cname, cmeta in cmetas.items():
             if cmeta.get("deprecated", False):
                 msg = f"Component {cname} is deprecated."
                 if "replaced_by" in cmeta:
@@ -327,10 +387,17 @@ class Config:
                 click.echo(f" > Unable to auto-discover OIDC config: {e}")
 
 
-def _component_is_aliasable(cluster_parameters: dict, component_name: str):
-    ckey = component_parameters_key(component_name)
-    cmeta = cluster_parameters[ckey].get("_metadata", {})
-    return cmeta.get("multi_instance", False)
+def _looks_like_api_token(value: str) -> bool:
+    """Check whether `value` is clearly a token rather than a path to a token file.
+
+    We treat values which contain newlines, JWTs and values which are too long to be a
+    single file name as tokens.
+    """
+    if "\n" in value:
+        return True
+    if value.startswith("eyJ") and value.count(".") == 2:
+        return True
+    return len(value) > 255 and "/" not in value
 
 
 def set_fact_value(facts: dict[str, Any], raw_key: str, value: Any) -> None:
@@ -340,13 +407,13 @@ def set_fact_value(facts: dict[str, Any], raw_key: str, value: Any) -> None:
     the raw key contains an empty segment, the function won't set a value and will
     instead print a diagnostic message.
     """
-    key_parts = raw_key.split(".")
-
-    if any(kp == "" for kp in key_parts):
+    if _NESTED_KEY_RE.fullmatch(raw_key) is None:
         # Bail out early if the raw key is malformed (any empty segment)
         click.secho(f"Malformed nested key '{raw_key}' skipping...", fg="yellow")
         return
 
+    key_parts = raw_key.split(".")
+
     prefix_key = ""
     target_dict = facts
     for k in key_parts[:-1]:
@@ -63,6 +63,8 @@ def fetch_components(cfg: Config):
     """
 
     click.secho("Discovering components...", bold=True)
+    # Inventory may have changed since the last time we've rendered it
+    cfg.invalidate_inventory_cache()
     cfg.inventory.ensure_dirs()
     component_names, component_aliases = _discover_components(cfg)
     click.secho("Registering component aliases...", bold=True)
@@ -94,6 +96,8 @@ def register_components(cfg: Config):
     Create component symlinks for discovered components which exist.
     """
     click.secho("Discovering included components...", bold=True)
+    # Inventory may have changed since the last time we've rendered it
+    cfg.invalidate_inventory_cache()
     try:
         components, component_aliases = _discover_components(cfg)
         cspecs = _read_components(cfg, components)
@@ -143,6 +147,8 @@ def fetch_packages(cfg: Config):
     """
 
     click.secho("Discovering config packages...", bold=True)
+    # Inventory may have changed since the last time we've rendered it
+    cfg.invalidate_inventory_cache()
     cfg.inventory.ensure_dirs()
     pkgs = _discover_packages(cfg)
     pspecs = _read_packages(cfg, pkgs)
@@ -172,6 +178,8 @@ def register_packages(cfg: Config):
     """
 
     click.secho("Discovering config packages...", bold=True)
+    # Inventory may have changed since the last time we've rendered it
+    cfg.invalidate_inventory_cache()
     cfg.inventory.ensure_dirs()
     pkgs = _discover_packages(cfg)
     pspecs = _read_packages(cfg, pkgs)
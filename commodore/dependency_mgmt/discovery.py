@@ -57,7 +57,7 @@ def _discover_components(cfg) -> tuple[list[str], dict[str, str]]:
     The function also verifies the extracted entries, and raises an exception if any
     invalid aliases are found.
     """
-    kapitan_applications = kapitan_inventory(cfg, key="applications")
+    kapitan_applications = kapitan_inventory(cfg, key="applications", cached=True)
 
     components, all_component_aliases = _extract_component_aliases(
         cfg, kapitan_applications.keys()
@@ -116,7 +116,7 @@ def _discover_packages(cfg: Config) -> set[str]:
     `_discover_components()`.
     """
     kapitan_applications = kapitan_inventory(
-        cfg, key="applications", ignore_class_notfound=True
+        cfg, key="applications", ignore_class_notfound=True, cached=True
     )
 
     packages = set()
@@ -34,17 +34,19 @@ class DependencySpec:
 
     @classmethod
     def parse(cls, info: dict[str, str]) -> DependencySpec:
-        if "url" not in info:
-            raise DependencyParseError("url")
+        try:
+            url = info["url"]
+        except KeyError as e:
+            raise DependencyParseError("url") from e
 
-        if "version" not in info:
-            raise DependencyParseError("version")
+        try:
+            version = info["version"]
+        except KeyError as e:
+            raise DependencyParseError("version") from e
 
-        path = info.get("path", "")
-        if path.startswith("/"):
-            path = path[1:]
+        path = info.get("path", "").lstrip("/")
 
-        return DependencySpec(info["url"], info["version"], path)
+        return DependencySpec(url, version, path)
 
 
 def _read_versions(
@@ -57,9 +59,10 @@ def _read_versions(
     deps_key = dependency_type.value
     deptype_str = dependency_type.name.lower()
     deptype_cap = deptype_str.capitalize()
-    dependencies = {}
 
-    inv = kapitan_inventory(cfg, ignore_class_notfound=ignore_class_notfound)
+    inv = kapitan_inventory(
+        cfg, ignore_class_notfound=ignore_class_notfound, cached=True
+    )
     cluster_inventory = inv[cfg.inventory.bootstrap_target]
     deps = cluster_inventory["parameters"].get(deps_key, None)
     if not deps:
@@ -71,28 +74,33 @@ def _read_versions(
         # just set deps to the empty dict.
         deps = {}
 
-    for depname in dependency_names:
-        if depname not in deps:
+    debug = cfg.debug
+
+    def _validate(depname: str) -> DependencySpec:
+        info = deps.get(depname)
+        if info is None:
             raise click.ClickException(
                 f"Unknown {deptype_str} '{depname}'."
                 + f" Please add it to 'parameters.{deps_key}'"
             )
 
         try:
-            dep = DependencySpec.parse(deps[depname])
+            dep = DependencySpec.parse(info)
         except DependencyParseError as e:
             raise click.ClickException(
                 f"{deptype_cap} '{depname}' is missing field '{e.field}'"
             )
 
-        if cfg.debug:
-            click.echo(f" > URL for {depname}: {dep.url}")
-            click.echo(f" > Version for {depname}: {dep.version}")
-            click.echo(f" > Subpath for {depname}: {dep.path}")
+        if debug:
+            click.echo(
+                f" > URL for {depname}: {dep.url}\n"
+                + f" > Version for {depname}: {dep.version}\n"
+                + f" > Subpath for {depname}: {dep.path}"
+            )
 
-        dependencies[depname] = dep
+        return dep
 
-    return dependencies
+    return {depname: _validate(depname) for depname in dependency_names}
 
 
 def _read_components(
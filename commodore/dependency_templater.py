@@ -3,6 +3,7 @@ from __future__ import annotations
 import datetime
 import difflib
 import json
+import os
 import re
 import tempfile
 import shutil
@@ -10,7 +11,7 @@ import textwrap
 
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 import click
 
@@ -74,6 +75,7 @@ class Templater(ABC):
     template_url: str
     template_version: Optional[str] = None
     _test_cases: list[str] = ["defaults"]
+    _cruft_json_cache: Optional[dict[str, Any]] = None
 
     def __init__(
         self,
@@ -89,6 +91,7 @@ class Templater(ABC):
         self.template_version = template_version
         self.slug = slug
         self._name = name
+        self._cruft_json_cache = None
         self.today = datetime.date.today()
         if output_dir != "":
             odir = Path(output_dir)
@@ -123,6 +126,10 @@ class Templater(ABC):
         )
         t._target_dir = path
         t.output_dir = path.absolute().parent
+        # We've already parsed `.cruft.json`, make sure we don't read it again.
+        # Because we pass `cookiecutter_args` by reference below, the cached data will
+        # contain any args which are added by `_initialize_from_cookiecutter_args()`.
+        t._cruft_json_cache = cruft_json
 
         # We pass the cookiecutter args dict to `_initialize_from_cookiecutter_args()`.
         # Because Python dicts are passed by reference, the function can simply add
@@ -185,11 +192,7 @@ class Templater(ABC):
         local_args = {
             "add_golden": "y" if self.golden_tests else "n",
             "copyright_holder": self.copyright_holder,
-            "copyright_year": (
-                self.today.strftime("%Y")
-                if not self.copyright_year
-                else self.copyright_year
-            ),
+            "copyright_year": self.copyright_year or str(self.today.year),
             "github_owner": self.github_owner,
             "name": self.name,
             "slug": self.slug,
@@ -197,18 +200,30 @@ class Templater(ABC):
             # spaces.
             "test_cases": " ".join(self.test_cases),
         }
-        cruft_json = self.target_dir / ".cruft.json"
-        if cruft_json.is_file():
-            with open(cruft_json, "r", encoding="utf-8") as f:
-                cruft_json_data = json.load(f)
-                args = cruft_json_data["context"]["cookiecutter"]
-            for k, v in local_args.items():
-                args[k] = v
+        cruft_json = self._load_cruft_json()
+        if cruft_json is not None:
+            args = {**cruft_json["context"]["cookiecutter"], **local_args}
         else:
             args = local_args
 
         return args
 
+    def _load_cruft_json(self) -> Optional[dict[str, Any]]:
+        """Return the parsed contents of the dependency's `.cruft.json`, or `None` if
+        the dependency doesn't have a `.cruft.json`.
+
+        The parsed contents are cached. Callers which modify `.cruft.json` must reset
+        `_cruft_json_cache` to `None`.
+        """
+        if self._cruft_json_cache is None:
+            cruft_json = self.target_dir / ".cruft.json"
+            if not cruft_json.is_file():
+                return None
+            with open(cruft_json, encoding="utf-8") as f:
+                self._cruft_json_cache = json.load(f)
+
+        return self._cruft_json_cache
+
     def _initialize_from_cookiecutter_args(self, cookiecutter_args: dict[str, str]):
         """This method sets the class properties corresponding to the cookiecutter
         template args from the provided cookiecutter_args dict.
@@ -236,7 +251,15 @@ class Templater(ABC):
             raise click.ClickException(
                 f"The {self.deptype} slug may not start with '{self.deptype}-'"
             )
-        if not SLUG_REGEX.match(value):
+        # Slugs are at least 3 characters long and start with a lowercase letter. We
+        # check this first to reject obviously invalid slugs without running the regex.
+        # We use `fullmatch()` as `$` in the pattern would also match before a trailing
+        # newline.
+        if (
+            len(value) < 3
+            or not "a" <= value[0] <= "z"
+            or not SLUG_REGEX.fullmatch(value)
+        ):
             raise click.ClickException(
                 f"The {self.deptype} slug must match '{SLUG_REGEX.pattern}'"
             )
@@ -280,35 +303,43 @@ class Templater(ABC):
 
     @property
     def template_commit(self) -> Optional[str]:
-        cruft_json = self.target_dir / ".cruft.json"
-        if not cruft_json.is_file():
+        cruft_json = self._load_cruft_json()
+        if cruft_json is None:
             click.echo(
                 f" > {self.deptype.capitalize()} doesn't have a `.cruft.json`, "
                 + "can't determine template commit."
             )
             return None
 
-        with open(cruft_json, "r", encoding="utf-8") as f:
-            cruft_json_data = json.load(f)
-            return cruft_json_data["commit"]
+        return cruft_json.get("commit")
 
     def create(self) -> None:
         click.secho(f"Adding {self.deptype} {self.name}...", bold=True)
 
-        if self.target_dir.exists():
+        # `target_dir` is computed on each access, compute it once here.
+        target_dir = self.target_dir
+        if target_dir.exists():
             raise click.ClickException(
                 f"Unable to add {self.deptype} {self.name}: "
-                + f"{self.target_dir} already exists."
+                + f"{target_dir} already exists."
             )
 
-        want_worktree = (
-            self.config.inventory.dependencies_dir in self.target_dir.parents
-        )
+        dependencies_dir = self.config.inventory.dependencies_dir
+        want_worktree = dependencies_dir in target_dir.parents
         if want_worktree:
-            md = MultiDependency(self.repo_url, self.config.inventory.dependencies_dir)
-            md.initialize_worktree(self.target_dir)
+            md = MultiDependency(self.repo_url, dependencies_dir)
+            md.initialize_worktree(target_dir)
 
-        with tempfile.TemporaryDirectory() as tmpdir:
+        else:
+            target_dir.parent.mkdir(parents=True, exist_ok=True)
+
+        # If we don't need to merge the rendered dependency into a pre-initialized
+        # worktree, render the template next to the target directory, so that we can
+        # move the rendered dependency into place with a single rename. Otherwise,
+        # render into the default temp location, so we never leave stray directories
+        # in the dependencies directory.
+        tmpdir_parent = None if want_worktree else target_dir.parent
+        with tempfile.TemporaryDirectory(dir=tmpdir_parent) as tmpdir:
             cruft_create(
                 self.template_url,
                 checkout=self.template_version,
@@ -316,9 +347,12 @@ class Templater(ABC):
                 no_input=True,
                 output_dir=Path(tmpdir),
             )
-            shutil.copytree(
-                Path(tmpdir) / self.slug, self.target_dir, dirs_exist_ok=True
-            )
+            rendered_dir = Path(tmpdir) / self.slug
+            if want_worktree:
+                shutil.copytree(rendered_dir, target_dir, dirs_exist_ok=True)
+            else:
+                os.rename(rendered_dir, target_dir)
+        self._cruft_json_cache = None
 
         self.commit("Initial commit", amend=want_worktree)
         click.secho(
@@ -335,16 +369,25 @@ class Templater(ABC):
             raise click.ClickException(
                 f"{self.deptype.capitalize()} template doesn't support removing all test cases."
             )
-        cruft_updated = cruft_update(
-            self.target_dir,
-            cookiecutter_input=False,
-            checkout=self.template_version,
-            extra_context=self.cookiecutter_args,
-        )
-        if not cruft_updated:
-            raise click.ClickException("Update from template failed")
+        # `cookiecutter_args` is computed on each access, compute it once here.
+        cookiecutter_args = self.cookiecutter_args
+        if self._template_up_to_date(cookiecutter_args):
+            # Rendering the template would produce exactly the files which we already
+            # have, skip the (expensive) cruft update.
+            updated = False
+        else:
+            cruft_updated = cruft_update(
+                self.target_dir,
+                cookiecutter_input=False,
+                checkout=self.template_version,
+                extra_context=cookiecutter_args,
+            )
+            # `cruft_update()` rewrites `.cruft.json`
+            self._cruft_json_cache = None
+            if not cruft_updated:
+                raise click.ClickException("Update from template failed")
 
-        updated = self._commit_or_print_changes(commit, ignore_template_commit)
+            updated = self._commit_or_print_changes(commit, ignore_template_commit)
 
         if print_completion_message:
             if not commit and updated:
@@ -365,6 +408,21 @@ class Templater(ABC):
 
         return updated
 
+    def _template_up_to_date(self, cookiecutter_args: dict[str, str]) -> bool:
+        """Check whether the dependency was last rendered from the requested template
+        commit with the current cookiecutter args.
+
+        We only consider dependencies whose template version is pinned to the exact
+        commit recorded in `.cruft.json`, since branches and tags can move.
+        """
+        cruft_json = self._load_cruft_json()
+        if cruft_json is None or not self.template_version:
+            return False
+        if cruft_json.get("commit") != self.template_version:
+            return False
+        context = cruft_json.get("context", {}).get("cookiecutter", {})
+        return all(context.get(k) == v for k, v in cookiecutter_args.items())
+
     def _commit_or_print_changes(
         self, commit: bool, ignore_template_commit: bool
     ) -> bool:
@@ -27,6 +27,12 @@ from kapitan.resources import inventory_reclass
 from commodore import __install_dir__
 from commodore.config import Config
 
+# Use the libyaml-based loader if PyYAML was built with libyaml support
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader as _SafeLoader  # type: ignore
+
 
 ArgumentCache = collections.namedtuple("ArgumentCache", ["inventory_path"])
 
@@ -49,7 +55,7 @@ def yaml_load(file):
     Load single-document YAML and return document
     """
     with open(file, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=_SafeLoader)  # nosec B506
 
 
 def yaml_load_all(file):
@@ -57,7 +63,19 @@ def yaml_load_all(file):
     Load multi-document YAML and return documents in list
     """
     with open(file, "r", encoding="utf-8") as f:
-        return list(yaml.safe_load_all(f))
+        return list(yaml.load_all(f, Loader=_SafeLoader))  # nosec B506
+
+
+def yaml_load_first(data: bytes, count: int):
+    """
+    Load at most `count` documents of multi-document YAML `data` and return documents
+    in list
+
+    Documents after the first `count` documents aren't parsed at all.
+    """
+    return list(
+        itertools.islice(yaml.load_all(data, Loader=_SafeLoader), count)  # nosec B506
+    )
 
 
 def _represent_str(dumper, data):
@@ -192,16 +210,28 @@ def kapitan_compile(
 
 
 def kapitan_inventory(
-    config: Config, key: str = "nodes", ignore_class_notfound: bool = False
+    config: Config,
+    key: str = "nodes",
+    ignore_class_notfound: bool = False,
+    cached: bool = False,
 ) -> dict:
     """
     Reset reclass cache and render inventory.
     Returns the top-level key according to the kwarg.
+
+    If `cached` is True, the rendered inventory is stored in the config object and
+    reused by subsequent cached calls with the same value for `ignore_class_notfound`
+    until `config.invalidate_inventory_cache()` is called.
     """
+    if cached and ignore_class_notfound in config.inventory_cache:
+        return config.inventory_cache[ignore_class_notfound][key]
+
     reset_reclass_cache()
     inv = inventory_reclass(
         config.inventory.inventory_dir, ignore_class_notfound=ignore_class_notfound
     )
+    if cached:
+        config.inventory_cache[ignore_class_notfound] = inv
     return inv[key]
 
 
@@ -1,17 +1,23 @@
 from __future__ import annotations
 
 import abc
+import functools
 import glob
+import io
+import os
 
 from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, Protocol
 
 import click
 import yaml
 
 from commodore.config import Config
-from commodore.helpers import yaml_load_all
+from commodore.helpers import yaml_load_first
 
 
 from .lint_dependency_specification import lint_components, lint_packages
@@ -26,53 +32,99 @@ class LintFunc(Protocol):
 class Linter:
     @abc.abstractmethod
     def __call__(
-        self, config: Config, path: Path, ignore_patterns: tuple[str, ...] = ()
+        self,
+        config: Config,
+        path: Path,
+        ignore_patterns: tuple[str, ...] = (),
+        jobs: int = 1,
     ) -> int:
         ...
 
 
 class ComponentSpecLinter(Linter):
     def __call__(
-        self, config: Config, path: Path, ignore_patterns: tuple[str, ...] = ()
+        self,
+        config: Config,
+        path: Path,
+        ignore_patterns: tuple[str, ...] = (),
+        jobs: int = 1,
     ) -> int:
-        return run_linter(config, path, ignore_patterns, lint_components)
+        return run_linter(
+            config,
+            path,
+            ignore_patterns,
+            lint_components,
+            parameters_only=True,
+            jobs=jobs,
+        )
 
 
 class DeprecatedParameterLinter(Linter):
     def __call__(
-        self, config: Config, path: Path, ignore_patterns: tuple[str, ...] = ()
+        self,
+        config: Config,
+        path: Path,
+        ignore_patterns: tuple[str, ...] = (),
+        jobs: int = 1,
     ) -> int:
-        return run_linter(config, path, ignore_patterns, lint_deprecated_parameters)
+        return run_linter(
+            config, path, ignore_patterns, lint_deprecated_parameters, jobs=jobs
+        )
 
 
 class PackageSpecLinter(Linter):
     def __call__(
-        self, config: Config, path: Path, ignore_patterns: tuple[str, ...] = ()
+        self,
+        config: Config,
+        path: Path,
+        ignore_patterns: tuple[str, ...] = (),
+        jobs: int = 1,
     ) -> int:
-        return run_linter(config, path, ignore_patterns, lint_packages)
+        return run_linter(
+            config,
+            path,
+            ignore_patterns,
+            lint_packages,
+            parameters_only=True,
+            jobs=jobs,
+        )
 
 
-LINTERS = {
-    "components": ComponentSpecLinter(),
-    "deprecated-parameters": DeprecatedParameterLinter(),
-    "packages": PackageSpecLinter(),
-}
+LINTERS = MappingProxyType(
+    {
+        "components": ComponentSpecLinter(),
+        "deprecated-parameters": DeprecatedParameterLinter(),
+        "packages": PackageSpecLinter(),
+    }
+)
 
 
-def _lint_file(cfg: Config, file: Path, lintfunc: LintFunc) -> int:
+def _lint_file(
+    debug: bool, file: Path, lintfunc: LintFunc, parameters_only: bool = False
+) -> int:
     errcount = 0
+    # We read the raw file contents once, and use them both for the prescan and for
+    # parsing. This also lets libyaml decode the file contents itself.
+    raw = file.read_bytes()
+    if parameters_only and not debug and b"parameters" not in raw:
+        # Cheaply skip files which can't contain key `parameters` without parsing them
+        # as YAML. Linting such a file never finds any errors. In debug mode, we parse
+        # the file anyway to report why it's skipped.
+        return errcount
     try:
-        filecontents = yaml_load_all(file)
+        # We only lint single-document files, so we never need to parse more than two
+        # documents to decide whether to lint a file.
+        filecontents = yaml_load_first(raw, 2)
         if len(filecontents) == 0:
-            if cfg.debug:
+            if debug:
                 click.echo(f"> Skipping empty file {file}")
         elif len(filecontents) > 1:
-            if cfg.debug:
+            if debug:
                 click.echo(
                     f"> Skipping file {file}: Linting multi-document YAML streams is not supported",
                 )
         elif not isinstance(filecontents[0], dict):
-            if cfg.debug:
+            if debug:
                 click.echo(
                     f"> Skipping file {file}: Expected top-level dictionary in YAML document"
                 )
@@ -80,32 +132,72 @@ def _lint_file(cfg: Config, file: Path, lintfunc: LintFunc) -> int:
             errcount = lintfunc(file, filecontents[0])
 
     except (yaml.YAMLError, UnicodeDecodeError) as e:
-        if cfg.debug:
+        if debug:
             click.echo(f"> Skipping file {file}: Unable to load as YAML: {e}")
 
     return errcount
 
 
+def _lint_file_worker(
+    debug: bool, lintfunc: LintFunc, parameters_only: bool, file: Path
+) -> tuple[int, str]:
+    """Wrapper for `_lint_file()` which is run in a worker process.
+
+    The output of the lint function is captured and returned to the caller, so that the
+    output of the individual files doesn't get interleaved."""
+    with redirect_stdout(io.StringIO()) as out:
+        errcount = _lint_file(debug, file, lintfunc, parameters_only)
+    return errcount, out.getvalue()
+
+
+def _collect_files(cfg: Config, path: Path, ignore_paths: set[Path]) -> list[Path]:
+    """Recursively collect all YAML files in `path` which aren't hidden or ignored."""
+    files = []
+    with os.scandir(path) as it:
+        for dentry in it:
+            if dentry.name.startswith("."):
+                if cfg.debug:
+                    click.echo(f"> Skipping hidden directory entry {dentry.path}")
+                continue
+            dpath = Path(dentry.path)
+            if dpath.absolute() in ignore_paths:
+                if cfg.debug:
+                    click.echo(f"> Skipping ignored directory entry {dpath}")
+                continue
+            # `DirEntry.is_dir()` can usually answer from the data returned by
+            # `scandir()` without an additional `stat()`.
+            if dentry.is_dir():
+                files.extend(_collect_files(cfg, dpath, ignore_paths))
+            elif dentry.name.endswith((".yml", ".yaml")):
+                files.append(dpath)
+            elif cfg.debug:
+                click.echo(f"> Skipping non-YAML file {dpath}")
+    return files
+
+
 def _lint_directory(
-    cfg: Config, path: Path, ignore_paths: set[Path], lintfunc: LintFunc
+    cfg: Config,
+    path: Path,
+    ignore_paths: set[Path],
+    lintfunc: LintFunc,
+    parameters_only: bool = False,
+    jobs: int = 1,
 ) -> int:
     if not path.is_dir():
         raise ValueError("Unexpected path argument: expected to be a directory")
 
+    files = _collect_files(cfg, path, ignore_paths)
+    if jobs <= 1:
+        return sum(
+            _lint_file(cfg.debug, file, lintfunc, parameters_only) for file in files
+        )
+
     errcount = 0
-    for dentry in path.iterdir():
-        if dentry.stem.startswith("."):
-            if cfg.debug:
-                click.echo(f"> Skipping hidden directory entry {dentry}")
-            continue
-        if dentry.absolute() in ignore_paths:
-            if cfg.debug:
-                click.echo(f"> Skipping ignored directory entry {dentry}")
-            continue
-        if dentry.is_dir():
-            errcount += _lint_directory(cfg, dentry, ignore_paths, lintfunc)
-        else:
-            errcount += _lint_file(cfg, dentry, lintfunc)
+    worker = functools.partial(_lint_file_worker, cfg.debug, lintfunc, parameters_only)
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        for ec, output in executor.map(worker, files, chunksize=32):
+            click.echo(output, nl=False)
+            errcount += ec
     return errcount
 
 
@@ -146,7 +238,12 @@ def _render_ignore_patterns(
 
 
 def run_linter(
-    cfg: Config, path: Path, ignore_patterns: tuple[str, ...], lintfunc: LintFunc
+    cfg: Config,
+    path: Path,
+    ignore_patterns: tuple[str, ...],
+    lintfunc: LintFunc,
+    parameters_only: bool = False,
+    jobs: int = 1,
 ) -> int:
     """Run lint function `lintfunc` in `path`.
 
@@ -154,6 +251,12 @@ def run_linter(
     (recursively).
     If `path` is a file, run the lint function in that file, if it's a YAML file.
 
+    If `parameters_only` is True, files which don't contain the string `parameters`
+    are skipped without parsing them, since `lintfunc` only inspects key `parameters`.
+
+    If `jobs` is larger than 1, files in directories are linted in `jobs` worker
+    processes.
+
     Returns a value that can be used as exit code to indicate whether there were linting
     errors.
     """
@@ -168,9 +271,9 @@ def run_linter(
         return 0
 
     if path.is_dir():
-        return _lint_directory(cfg, path, ignore_paths, lintfunc)
+        return _lint_directory(cfg, path, ignore_paths, lintfunc, parameters_only, jobs)
 
-    return _lint_file(cfg, path, lintfunc)
+    return _lint_file(cfg.debug, path, lintfunc, parameters_only)
 
 
 def check_removed_reclass_variables(
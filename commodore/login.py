@@ -14,7 +14,6 @@ from http.server import BaseHTTPRequestHandler, HTTPServer
 from urllib.parse import urlparse, parse_qs
 
 import click
-import jwt
 import requests
 
 # pylint: disable=redefined-builtin
@@ -225,11 +224,8 @@ def refresh_tokens(
         return False
     # We don't verify the signature, we just want to know if the refresh token is
     # expired.
-    try:
-        t = jwt.decode(
-            refresh_token, algorithms=["RS256"], options={"verify_signature": False}
-        )
-    except jwt.exceptions.InvalidTokenError:
+    t = tokencache.peek_claims(refresh_token)
+    if t is None:
         # We can't parse the refresh token, notify caller that they need to request a
         # fresh set of tokens.
         return False
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import sys
+
 from pathlib import Path
 from typing import Optional
 
@@ -106,10 +108,13 @@ def dependency_dir(base_dir: Path, repo_url: str) -> Path:
 def dependency_key(repo_url: str) -> str:
     """Create normalized and scheme-agnostic key for the given repo URL.
 
-    This is also used to determine the subpath where the bare checkout is created."""
+    This is also used to determine the subpath where the bare checkout is created.
+
+    The returned key is interned, so that lookups of a dependency key in a dict
+    of registered dependencies can short-circuit on object identity."""
     repo_url = normalize_git_url(repo_url)
     url_parts = deconstruct_url(repo_url)
     depkey = ""
     if url_parts.host:
         depkey = f"{url_parts.host}/"
-    return depkey + url_parts.path[1:]
+    return sys.intern(depkey + url_parts.path[1:])
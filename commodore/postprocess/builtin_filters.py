@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import functools
 import json
 
 from pathlib import Path as P
+from types import MappingProxyType
 
 import _jsonnet
 import click
@@ -19,6 +21,21 @@ def _output_dir(work_dir: P, instance: str, path):
     return work_dir / "compiled" / instance / path
 
 
+_HELM_NAMESPACE_FILTER = __install_dir__ / "filters" / "helm_namespace.jsonnet"
+
+
+@functools.lru_cache(maxsize=None)
+def _helm_namespace_src() -> str:
+    """Read the helm_namespace filter source once, instead of on each invocation of the
+    filter."""
+    return _HELM_NAMESPACE_FILTER.read_text(encoding="utf-8")
+
+
+def _evaluate_helm_namespace(filename: str, **kwargs) -> str:
+    # pylint: disable=c-extension-no-member
+    return _jsonnet.evaluate_snippet(filename, _helm_namespace_src(), **kwargs)
+
+
 def _builtin_filter_helm_namespace(
     work_dir: P, inv, component: Component, instance: str, path, **kwargs
 ):
@@ -31,19 +48,17 @@ def _builtin_filter_helm_namespace(
     # strings
     if isinstance(create_namespace, bool):
         create_namespace = "true" if create_namespace else "false"
-    exclude_objects = kwargs.get("exclude_objects", [])
-    exclude_objects = "|".join([json.dumps(e) for e in exclude_objects])
+    exclude_objects = "|".join(map(json.dumps, kwargs.get("exclude_objects", ())))
     output_dir = _output_dir(work_dir, instance, path)
 
-    # pylint: disable=c-extension-no-member
     jsonnet_runner(
         work_dir,
         inv,
         component.name,
         instance,
         path,
-        _jsonnet.evaluate_file,
-        __install_dir__ / "filters" / "helm_namespace.jsonnet",
+        _evaluate_helm_namespace,
+        _HELM_NAMESPACE_FILTER,
         namespace=kwargs["namespace"],
         create_namespace=create_namespace,
         exclude_objects=exclude_objects,
@@ -51,9 +66,11 @@ def _builtin_filter_helm_namespace(
     )
 
 
-_builtin_filters = {
-    "helm_namespace": _builtin_filter_helm_namespace,
-}
+_builtin_filters = MappingProxyType(
+    {
+        "helm_namespace": _builtin_filter_helm_namespace,
+    }
+)
 
 
 class UnknownBuiltinFilter(ValueError):
@@ -72,11 +89,10 @@ def run_builtin_filter(
     path: P,
     **filterargs: str,
 ):
-    if filterid not in _builtin_filters:
+    builtin_filter = _builtin_filters.get(filterid)
+    if builtin_filter is None:
         raise UnknownBuiltinFilter(filterid)
-    _builtin_filters[filterid](
-        config.work_dir, inv, component, instance, path, **filterargs
-    )
+    builtin_filter(config.work_dir, inv, component, instance, path, **filterargs)
 
 
 # pylint: disable=unused-argument
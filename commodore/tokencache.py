@@ -1,21 +1,48 @@
 from __future__ import annotations
 
+import functools
 import json
 import os
+import tempfile
 
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 
 import click
+import jwt
 from xdg.BaseDirectory import xdg_cache_home
 
 cache_name = Path(xdg_cache_home) / "commodore" / "token"
 
+# In-memory copy of the parsed token cache, together with the inode, modification
+# time and size of the cache file from which it was parsed. We only parse the cache
+# file again if it has been modified since we've last read it.
+_cache: Optional[tuple[tuple[int, int, int], dict[str, Any]]] = None
+
+
+def _stat_key(st: os.stat_result) -> tuple[int, int, int]:
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def _load() -> dict[str, Any]:
+    """Load the token cache.
+
+    Raises `OSError` if the cache file can't be read and `json.JSONDecodeError` if the
+    cache file doesn't contain valid JSON."""
+    global _cache  # pylint: disable=global-statement
+    with open(cache_name, "rb") as f:
+        key = _stat_key(os.fstat(f.fileno()))
+        if _cache is not None and _cache[0] == key:
+            return _cache[1]
+        cache = json.loads(f.read())
+    _cache = (key, cache)
+    return cache
+
 
 def save(lieutenant: str, token: dict[str, Any]):
+    global _cache  # pylint: disable=global-statement
     try:
-        with open(cache_name, "r", encoding="utf-8") as f:
-            cache = json.load(f)
+        cache = dict(_load())
     except (IOError, FileNotFoundError):
         cache = {}
     except json.JSONDecodeError:
@@ -25,17 +52,52 @@ def save(lieutenant: str, token: dict[str, Any]):
     cache[lieutenant] = token
 
     os.makedirs(os.path.dirname(cache_name), exist_ok=True)
-    with open(cache_name, "w", encoding="utf-8") as f:
-        f.write(json.dumps(cache, indent=1))
+    # Write the new cache contents to a temporary file and atomically replace the
+    # cache file, so concurrent readers never see a partially written cache.
+    f = tempfile.NamedTemporaryFile(
+        "w", encoding="utf-8", dir=cache_name.parent, delete=False
+    )
+    try:
+        with f:
+            json.dump(cache, f)
+        os.replace(f.name, cache_name)
+    finally:
+        # Don't leave the temporary file behind if writing or replacing failed
+        if os.path.exists(f.name):
+            os.unlink(f.name)
+    _cache = (_stat_key(os.stat(cache_name)), cache)
 
 
 def get(lieutenant: str) -> dict[str, Any]:
     try:
-        with open(cache_name, "r", encoding="utf-8") as f:
-            cache = json.load(f)
+        cache = _load()
     except (IOError, FileNotFoundError, json.JSONDecodeError):
         return {}
     data = cache.get(lieutenant, {})
     if isinstance(data, str):
         data = {}
-    return data
+    # Return a copy, so callers can't modify the in-memory cache
+    return dict(data)
+
+
+@functools.lru_cache(maxsize=128)
+def _decode_claims(token: str) -> Optional[dict[str, Any]]:
+    try:
+        return jwt.decode(
+            token, algorithms=["RS256"], options={"verify_signature": False}
+        )
+    except jwt.exceptions.InvalidTokenError:
+        return None
+
+
+def peek_claims(token: str) -> Optional[dict[str, Any]]:
+    """Decode JWT `token` without verifying its signature and return its claims.
+
+    Returns `None` if `token` isn't a well-formed JWT. The decoded claims are cached
+    per token, callers must compare the `exp` claim against the current time on each
+    call."""
+    claims = _decode_claims(token)
+    if claims is None:
+        return None
+    # Return a copy, so callers can't modify the cached claims
+    return dict(claims)
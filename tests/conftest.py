@@ -9,6 +9,7 @@ from pathlib import Path
 from typing import Protocol
 
 import pytest
+import yaml
 
 from click.testing import CliRunner, Result
 from git import Repo
@@ -17,18 +18,55 @@ from commodore import cli
 from commodore.config import Config
 from commodore.gitrepo import GitRepo
 
+# Use the libyaml-based loader and dumper in tests if PyYAML was built with libyaml
+# support
+try:
+    from yaml import CSafeLoader as SafeLoader
+    from yaml import CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader  # type: ignore # noqa: F401
+    from yaml import SafeDumper  # type: ignore # noqa: F401
+
+
+@pytest.fixture
+def git_test_env(monkeypatch):
+    """
+    Disable git housekeeping which is irrelevant for the short-lived test repos
+
+    Test modules which create and push to many repos opt in with
+    `pytestmark = pytest.mark.usefixtures("git_test_env")`.
+
+    The settings are passed to all git commands through `GIT_CONFIG_COUNT` and
+    `GIT_CONFIG_{KEY,VALUE}_<n>`. Setting `GIT_TEMPLATE_DIR` to the empty string
+    skips copying the sample hooks into each new repo.
+    """
+    settings = {
+        "gc.auto": "0",
+        "receive.autogc": "false",
+        "transfer.fsckObjects": "false",
+    }
+    monkeypatch.setenv("GIT_TEMPLATE_DIR", "")
+    monkeypatch.setenv("GIT_CONFIG_COUNT", str(len(settings)))
+    for i, (key, value) in enumerate(settings.items()):
+        monkeypatch.setenv(f"GIT_CONFIG_KEY_{i}", key)
+        monkeypatch.setenv(f"GIT_CONFIG_VALUE_{i}", value)
+
 
 class RunnerFunc(Protocol):
     def __call__(self, args: list[str]) -> Result:
         ...
 
 
-@pytest.fixture
-def cli_runner() -> RunnerFunc:
+def make_cli_runner() -> RunnerFunc:
     r = CliRunner()
     return lambda args: r.invoke(cli.commodore, args)
 
 
+@pytest.fixture
+def cli_runner() -> RunnerFunc:
+    return make_cli_runner()
+
+
 @pytest.fixture
 def config(tmp_path):
     """
@@ -113,3 +151,178 @@ class MockMultiDependency:
 @pytest.fixture
 def mockdep(tmp_path):
     return MockMultiDependency(Repo.init(tmp_path / "repo.git"))
+
+
+# Parameters for the test global defaults repo. The inventory tests import them to
+# compute the expected results.
+GLOBAL_PARAMS = {
+    "components": {
+        "tc1": {
+            "url": "tc1",
+            "version": "gp",
+        },
+        "tc2": {
+            "url": "tc2",
+            "version": "gp",
+        },
+        "tc3": {
+            "url": "tc3",
+            "version": "gp",
+        },
+        "tc4": {
+            "url": "tc4",
+            "version": "gp",
+        },
+        "tc5": {
+            "url": "tc5",
+            "version": "gp",
+        },
+    }
+}
+
+DIST_PARAMS = {
+    "a": {
+        "components": {
+            "tc1": {"version": "a_version"},
+        },
+    },
+    "b": {
+        "components": {
+            "tc2": {"url": "b_url"},
+        },
+    },
+    "c": {"other_key": {}},
+    "d": {"test": "testing"},
+    # Test that multi-instance related params work correctly
+    "e": {"namespace": "${_instance}"},
+}
+
+CLOUD_REGION_PARAMS = {
+    "x": {
+        "components": {
+            "tc1": {"version": "x_version"},
+        },
+    },
+    "y": [
+        (
+            "params",
+            {
+                "components": {
+                    "tc1": {"url": "y_params_url", "version": "y_params_version"},
+                }
+            },
+        ),
+        ("m", {"components": {"tc4": {"url": "y_m_url"}}}),
+        ("n", {"components": {"tc4": {"version": "y_n_version"}}}),
+        ("o", {}),
+    ],
+    "z": [("a", {})],
+}
+
+
+def setup_global_repo_dir(
+    tmp_path: Path, global_params, distparams, cloud_region_params
+) -> Path:
+    global_path = tmp_path / "global-defaults"
+    created: set[Path] = set()
+
+    def _dump(data, path: Path):
+        # Only create each parent directory once
+        if path.parent not in created:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            created.add(path.parent)
+        path.write_text(yaml.dump(data, Dumper=SafeDumper), encoding="utf-8")
+
+    ext = (".yml", ".yaml")
+    for i, (distribution, params) in enumerate(distparams.items()):
+        # alternate extensions for distribution classes
+        fext = ext[i & 1]
+        _dump(
+            {"parameters": params},
+            global_path / "distribution" / f"{distribution}{fext}",
+        )
+    for cloud, params in cloud_region_params.items():
+        if isinstance(params, dict):
+            _dump({"parameters": params}, global_path / "cloud" / f"{cloud}.yml")
+        else:
+            assert isinstance(params, list)
+            rparams = {}
+            for region, params in params:
+                if region == "params":
+                    rparams = params
+                    continue
+                _dump(
+                    {"parameters": params},
+                    global_path / "cloud" / cloud / f"{region}.yml",
+                )
+            # Write cloud-level params
+            _dump(
+                {"parameters": rparams},
+                global_path / "cloud" / cloud / "params.yml",
+            )
+            # Configure cloud region hierarchy
+            _dump(
+                {
+                    "classes": [
+                        f"global.cloud.{cloud}.params",
+                        f"global.cloud.{cloud}.${{facts:region}}",
+                    ],
+                },
+                global_path / "cloud" / f"{cloud}.yml",
+            )
+
+    # Write global params
+    _dump(
+        {"parameters": global_params},
+        global_path / "params.yml",
+    )
+
+    # Write hierarchy config
+    _dump(
+        {
+            "classes": [
+                "global.params",
+                "global.distribution.${facts:distribution}",
+                "global.cloud.${facts:cloud}",
+                "${cluster:tenant}.${cluster:name}",
+            ]
+        },
+        global_path / "commodore.yml",
+    )
+
+    return global_path
+
+
+@pytest.fixture(scope="session")
+def global_dir_full(tmp_path_factory) -> Path:
+    """
+    Setup the full test global defaults repo once per session (and xdist worker)
+
+    Tests must treat the returned directory as read-only, since it's shared by all
+    tests. `InventoryFactory.from_repo_dirs()` only symlinks the directory into the
+    test's inventory.
+    """
+    return setup_global_repo_dir(
+        tmp_path_factory.mktemp("global-dir-full"),
+        GLOBAL_PARAMS,
+        DIST_PARAMS,
+        CLOUD_REGION_PARAMS,
+    )
+
+
+@pytest.fixture(scope="session")
+def commodore_config_package_template(tmp_path_factory) -> Path:
+    """
+    Shallow clone of the Commodore config package template, shared by all tests
+
+    Tests must treat the clone as read-only.
+    """
+    p = tmp_path_factory.mktemp("cpt") / "template.git"
+    Repo.clone_from(
+        "https://github.com/projectsyn/commodore-config-package-template.git",
+        p,
+        depth=1,
+        single_branch=True,
+        no_tags=True,
+    )
+    return p
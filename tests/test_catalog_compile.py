@@ -1,12 +1,10 @@
 from __future__ import annotations
 
-import copy
+import functools
 import os
 import pytest
 import re
-import yaml
 
-from collections.abc import Iterable
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -15,6 +13,7 @@ import responses
 
 from commodore.cluster import Cluster, update_target, update_params
 from commodore.config import Config
+from commodore.helpers import yaml_load
 
 import commodore.compile as commodore_compile
 
@@ -27,26 +26,40 @@ def _mock_load_cluster_from_api(cfg: Config, cluster_id: str):
 
 
 def _verify_target(
-    target_dir: Path, expected_classes: Iterable[str], tname: str, bootstrap=False
+    target_dir: Path, full_classes: list[str], tname: str, bootstrap=False
 ):
     tpath = target_dir / f"{tname}.yml"
     assert tpath.is_file()
-    classes = copy.copy(expected_classes)
-    if not bootstrap:
-        classes.append(f"components.{tname}")
-    with open(tpath) as t:
-        tcontents = yaml.safe_load(t)
-        assert all(k in tcontents for k in ["classes", "parameters"])
-        assert tcontents["classes"] == classes
-        tparams = tcontents["parameters"]
-        assert "_instance" in tparams
-        assert tparams["_instance"] == tname
-        assert bootstrap or (
-            "kapitan" in tparams
-            and "vars" in tparams["kapitan"]
-            and "target" in tparams["kapitan"]["vars"]
-            and tparams["kapitan"]["vars"]["target"] == tname
-        )
+    tcontents = yaml_load(tpath)
+    assert all(k in tcontents for k in ["classes", "parameters"])
+    assert tcontents["classes"] == full_classes
+    tparams = tcontents["parameters"]
+    assert "_instance" in tparams
+    assert tparams["_instance"] == tname
+    assert bootstrap or (
+        "kapitan" in tparams
+        and "vars" in tparams["kapitan"]
+        and "target" in tparams["kapitan"]["vars"]
+        and tparams["kapitan"]["vars"]["target"] == tname
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _commit_res(short_sha_len: int) -> tuple[re.Pattern, re.Pattern, re.Pattern]:
+    """Compile the component, global and tenant commit line regexes for commit shas
+    of length `short_sha_len`"""
+    rev_re_fragment = rf"(?P<commit_sha>[0-9a-f]{{{short_sha_len}}})"
+    component_commit_re = re.compile(
+        r"^ \* (?P<component_name>[a-z-]+): "
+        + r"(?P<component_version>(None|v[0-9]+.[0-9]+.[0-9]+|[a-z0-9]{40})) "
+        + rf"\({rev_re_fragment}\)$"
+    )
+    global_commit_re = re.compile(rf"^ \* global: {rev_re_fragment}$")
+    tenant_commit_re = re.compile(rf"^ \* customer: {rev_re_fragment}$")
+    return component_commit_re, global_commit_re, tenant_commit_re
+
+
+_COMPILE_TS_RE = re.compile(r"^Compilation timestamp: (?P<ts>[0-9T.:-]+)$")
 
 
 def _verify_commit_message(
@@ -59,17 +72,7 @@ def _verify_commit_message(
     """
     Parse and check catalog commit message
     """
-
-    rev_re_fragment = rf"(?P<commit_sha>[0-9a-f]{{{short_sha_len}}})"
-
-    component_commit_re = re.compile(
-        r"^ \* (?P<component_name>[a-z-]+): "
-        + r"(?P<component_version>(None|v[0-9]+.[0-9]+.[0-9]+|[a-z0-9]{40})) "
-        + rf"\({rev_re_fragment}\)$"
-    )
-    global_commit_re = re.compile(rf"^ \* global: {rev_re_fragment}$")
-    tenant_commit_re = re.compile(rf"^ \* customer: {rev_re_fragment}$")
-    compile_ts_re = re.compile(r"^Compilation timestamp: (?P<ts>[0-9T.:-]+)$")
+    component_commit_re, global_commit_re, tenant_commit_re = _commit_res(short_sha_len)
 
     global_rev = git.Repo(tmp_path / "inventory/classes/global").head.commit.hexsha[
         :short_sha_len
@@ -82,24 +85,29 @@ def _verify_commit_message(
     assert commit_msg.startswith(
         "Automated catalog update from Commodore\n\nComponent commits:\n"
     )
-    commit_msg_lines = commit_msg.split("\n")[3:]
+    # commit message must end with a newline
+    assert commit_msg.endswith("\n")
+    commit_msg_lines = commit_msg.splitlines()[3:]
 
     components = config.get_components()
-    component_count = len(components.keys())
+    component_count = len(components)
+    # Expected version and commit sha for each component
+    expected_commits = {
+        cname: (str(c.version), c.repo.repo.head.commit.hexsha[:short_sha_len])
+        for cname, c in components.items()
+    }
 
     component_lines = commit_msg_lines[:component_count]
     for line in component_lines:
         m = component_commit_re.match(line)
         assert m, f"Unable to parse component commit line {line}"
         cname = m.group("component_name")
-        assert cname in components
-        c = components[cname]
-        assert str(c.version) == m.group("component_version")
-        assert c.repo.repo.head.commit.hexsha[:short_sha_len] == m.group("commit_sha")
+        assert cname in expected_commits
+        assert expected_commits[cname] == m.group("component_version", "commit_sha")
 
     # Remaining lines should be config commit shas and compilation timestamp
     rem_lines = commit_msg_lines[component_count:]
-    assert len(rem_lines) == 7
+    assert len(rem_lines) == 6
 
     # empty line before configuration commits
     assert rem_lines[0] == ""
@@ -115,7 +123,7 @@ def _verify_commit_message(
     # empty line after config commits
     assert rem_lines[4] == ""
 
-    compile_ts_match = compile_ts_re.match(rem_lines[5])
+    compile_ts_match = _COMPILE_TS_RE.match(rem_lines[5])
     assert compile_ts_match
     compile_ts_str = compile_ts_match.group("ts")
     compile_ts = datetime.fromisoformat(compile_ts_str)
@@ -126,9 +134,6 @@ def _verify_commit_message(
     # Commit message timestamp and commit timestamp should be within 1 second of each other
     assert abs(compile_ts - catalog_commit_ts) < timedelta(seconds=1)
 
-    # last line empty due to trailing \n in commit message
-    assert rem_lines[6] == ""
-
 
 @pytest.mark.integration
 @responses.activate
@@ -202,29 +207,34 @@ def test_catalog_compile(config: Config, tmp_path: Path, capsys):
     # Check config for expected components
     assert sorted(config.get_components().keys()) == sorted(expected_components)
 
-    # Output dirs
-    for output_dir in expected_dirs:
-        assert output_dir.is_dir()
+    # Output dirs: collect all directories (including symlinked directories) in a
+    # single walk of the working directory.
+    actual_dirs = set()
+    for root, dirs, _ in os.walk(tmp_path):
+        # We don't need to look into any Git metadata
+        dirs[:] = [d for d in dirs if d != ".git"]
+        actual_dirs.update(Path(root, d) for d in dirs)
+    missing_dirs = set(expected_dirs) - actual_dirs
+    assert not missing_dirs
 
     # Verify params.cluster
-    with open(tmp_path / "inventory/classes/params/cluster.yml") as f:
-        fcontents = yaml.safe_load(f)
-        assert "parameters" in fcontents
-        params = fcontents["parameters"]
-        assert all(k in params for k in ["cluster", "facts"])
-        assert all(k in params["cluster"] for k in ["catalog_url", "name", "tenant"])
-        assert params["cluster"]["catalog_url"] == cluster_resp["gitRepo"]["url"]
-        assert params["cluster"]["name"] == cluster_resp["id"]
-        assert params["cluster"]["tenant"] == cluster_resp["tenant"]
-        for k, v in params["facts"].items():
-            assert v == cluster_resp["facts"][k]
+    fcontents = yaml_load(tmp_path / "inventory/classes/params/cluster.yml")
+    assert "parameters" in fcontents
+    params = fcontents["parameters"]
+    assert all(k in params for k in ["cluster", "facts"])
+    assert all(k in params["cluster"] for k in ["catalog_url", "name", "tenant"])
+    assert params["cluster"]["catalog_url"] == cluster_resp["gitRepo"]["url"]
+    assert params["cluster"]["name"] == cluster_resp["id"]
+    assert params["cluster"]["tenant"] == cluster_resp["tenant"]
+    for k, v in params["facts"].items():
+        assert v == cluster_resp["facts"][k]
 
     # TODO: Targets
     target_dir = tmp_path / "inventory/targets"
 
     _verify_target(target_dir, expected_classes, "cluster", bootstrap=True)
     for cn in expected_components:
-        _verify_target(target_dir, expected_classes, cn)
+        _verify_target(target_dir, expected_classes + [f"components.{cn}"], cn)
 
     # Catalog checks
     catalog_manifests = tmp_path / "catalog/manifests"
@@ -272,10 +282,8 @@ def _prepare_commodore_working_dir(config: Config, components):
     # Create directories which aren't created in local mode
     config.inventory.ensure_dirs()
 
-    with open(config.inventory.global_config_dir / "params.yml") as pf:
-        global_params = yaml.safe_load(pf)
-    with open(Path(tr.working_tree_dir) / "c-test.yml") as cf:
-        cluster_params = yaml.safe_load(cf)
+    global_params = yaml_load(config.inventory.global_config_dir / "params.yml")
+    cluster_params = yaml_load(Path(tr.working_tree_dir) / "c-test.yml")
     gvers = global_params["parameters"]["components"]
     tvers = cluster_params["parameters"]["components"]
     for c in components:
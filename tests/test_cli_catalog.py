@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import json
+
 from pathlib import Path
 from typing import Any
 from unittest import mock
@@ -13,6 +15,8 @@ from test_catalog import cluster_resp
 
 from conftest import RunnerFunc
 
+_CLUSTER_LIST_RESP = json.dumps([cluster_resp]).encode("utf-8")
+
 
 @responses.activate
 def test_catalog_list_cli(cli_runner: RunnerFunc):
@@ -20,7 +24,8 @@ def test_catalog_list_cli(cli_runner: RunnerFunc):
         responses.GET,
         "https://syn.example.com/clusters/",
         status=200,
-        json=[cluster_resp],
+        body=_CLUSTER_LIST_RESP,
+        content_type="application/json",
     )
 
     result = cli_runner(
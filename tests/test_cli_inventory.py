@@ -8,7 +8,7 @@ from typing import Any
 import pytest
 import yaml
 
-from conftest import RunnerFunc
+from conftest import RunnerFunc, SafeDumper
 
 
 @pytest.mark.parametrize(
@@ -71,18 +71,20 @@ from conftest import RunnerFunc
         ),
     ],
 )
+@pytest.mark.parametrize("jobs", [1, 2])
 def test_inventory_lint_cli(
     tmp_path: Path,
     files: dict[str, dict[str, Any]],
     exitcode: int,
     stdout: list[str],
     cli_runner: RunnerFunc,
+    jobs: int,
 ):
     for f, data in files.items():
         with open(tmp_path / f, "w") as fh:
-            yaml.safe_dump(data, fh)
+            yaml.dump(data, fh, Dumper=SafeDumper)
 
-    result = cli_runner(["inventory", "lint", str(tmp_path)])
+    result = cli_runner(["inventory", "lint", "-j", str(jobs), str(tmp_path)])
 
     assert result.exit_code == exitcode
     print(result.stdout)
@@ -109,10 +111,12 @@ def test_component_versions_cli(
     global_config = tmp_path / "global"
     global_config.mkdir()
     with open(global_config / "commodore.yml", "w") as f:
-        yaml.safe_dump({"classes": ["global.test"]}, f)
+        yaml.dump({"classes": ["global.test"]}, f, Dumper=SafeDumper)
 
     with open(global_config / "test.yml", "w") as f:
-        yaml.safe_dump({"classes": ["foo.bar"], "parameters": parameters}, f)
+        yaml.dump(
+            {"classes": ["foo.bar"], "parameters": parameters}, f, Dumper=SafeDumper
+        )
 
     result = cli_runner(["inventory", "components", str(global_config)] + args)
 
@@ -145,10 +149,12 @@ def test_package_versions_cli(
     global_config = tmp_path / "global"
     global_config.mkdir()
     with open(global_config / "commodore.yml", "w") as f:
-        yaml.safe_dump({"classes": ["global.test"]}, f)
+        yaml.dump({"classes": ["global.test"]}, f, Dumper=SafeDumper)
 
     with open(global_config / "test.yml", "w") as f:
-        yaml.safe_dump({"classes": ["foo.bar"], "parameters": parameters}, f)
+        yaml.dump(
+            {"classes": ["foo.bar"], "parameters": parameters}, f, Dumper=SafeDumper
+        )
 
     result = cli_runner(["inventory", "packages", str(global_config)] + args)
 
@@ -190,10 +196,12 @@ def test_show_inventory_cli(
     global_config = tmp_path / "global"
     global_config.mkdir()
     with open(global_config / "commodore.yml", "w") as f:
-        yaml.safe_dump({"classes": ["global.test"]}, f)
+        yaml.dump({"classes": ["global.test"]}, f, Dumper=SafeDumper)
 
     with open(global_config / "test.yml", "w") as f:
-        yaml.safe_dump({"classes": ["foo.bar"], "parameters": parameters}, f)
+        yaml.dump(
+            {"classes": ["foo.bar"], "parameters": parameters}, f, Dumper=SafeDumper
+        )
 
     result = cli_runner(["inventory", "show", str(global_config)] + args)
 
@@ -15,7 +15,7 @@ from commodore.cli import package
 from commodore.package import Package
 from commodore.package.template import PackageTemplater
 
-from conftest import RunnerFunc
+from conftest import RunnerFunc, SafeDumper
 
 
 @mock.patch.object(package, "sync_dependencies")
@@ -29,7 +29,7 @@ def test_package_sync_cli(
 
     pkg_list = tmp_path / "pkgs.yaml"
     with open(pkg_list, "w", encoding="utf-8") as f:
-        yaml.safe_dump(["projectsyn/package-foo"], f)
+        yaml.dump(["projectsyn/package-foo"], f, Dumper=SafeDumper)
 
     def sync_pkgs(
         config,
@@ -21,6 +21,7 @@ from test_component import setup_directory
 
 from commodore.component import template
 from commodore.config import Config
+from commodore.helpers import yaml_load
 
 
 def call_component_new(
@@ -102,18 +103,17 @@ def _validate_rendered_component(
     assert not repo.is_dirty()
     assert not repo.untracked_files
     # Verify component class
-    with open(
+    class_contents = yaml_load(
         tmp_path / "dependencies" / component_name / "class" / f"{component_name}.yml"
-    ) as cclass:
-        class_contents = yaml.safe_load(cclass)
-        assert "parameters" in class_contents
-        params = class_contents["parameters"]
-        assert "kapitan" in params
-        if has_pp:
-            assert "commodore" in params
-            assert "postprocess" in params["commodore"]
-            assert "filters" in params["commodore"]["postprocess"]
-            assert isinstance(params["commodore"]["postprocess"]["filters"], list)
+    )
+    assert "parameters" in class_contents
+    params = class_contents["parameters"]
+    assert "kapitan" in params
+    if has_pp:
+        assert "commodore" in params
+        assert "postprocess" in params["commodore"]
+        assert "filters" in params["commodore"]["postprocess"]
+        assert isinstance(params["commodore"]["postprocess"]["filters"], list)
 
     with open(
         tmp_path
@@ -304,7 +304,7 @@ def test_run_component_new_command_with_output_dir(tmp_path: P, cli_runner: Runn
     assert not (tmp_path / "dependencies").exists()
 
 
-def test_run_component_new_command_with_name(tmp_path: P):
+def test_run_component_new_command_with_name(tmp_path: P, cli_runner: RunnerFunc):
     """
     Run the component new command with the slug option set
     """
@@ -316,12 +316,20 @@ def test_run_component_new_command_with_name(tmp_path: P):
     readme_path = tmp_path / "dependencies" / component_slug / "README.md"
     cruftjson_path = tmp_path / "dependencies" / component_slug / ".cruft.json"
 
-    exit_status = call(
-        f"commodore -d {tmp_path} -vvv component new --name '{component_name}' {component_slug}",
-        shell=True,
+    result = cli_runner(
+        [
+            "-d",
+            str(tmp_path),
+            "-vvv",
+            "component",
+            "new",
+            "--name",
+            component_name,
+            component_slug,
+        ]
     )
 
-    assert exit_status == 0
+    assert result.exit_code == 0
     assert os.path.exists(readme_path)
 
     with open(readme_path, "r") as file:
@@ -345,15 +353,15 @@ def test_run_component_new_command_with_name(tmp_path: P):
         "test_illegal",
     ],
 )
-def test_run_component_new_command_with_illegal_slug(tmp_path: P, test_input):
+def test_run_component_new_command_with_illegal_slug(
+    tmp_path: P, cli_runner: RunnerFunc, test_input
+):
     """
     Run the component new command with an illegal slug
     """
     setup_directory(tmp_path)
-    exit_status = call(
-        f"commodore -d {tmp_path} -vvv component new {test_input}", shell=True
-    )
-    assert exit_status != 0
+    result = cli_runner(["-d", str(tmp_path), "-vvv", "component", "new", test_input])
+    assert result.exit_code != 0
 
 
 def test_run_component_new_then_delete(tmp_path: P, cli_runner: RunnerFunc):
@@ -388,7 +396,7 @@ def test_run_component_new_then_delete(tmp_path: P, cli_runner: RunnerFunc):
     assert not (tmp_path / "inventory" / "targets" / f"{component_name}.yml").exists()
 
 
-def test_deleting_inexistant_component(tmp_path: P):
+def test_deleting_inexistant_component(tmp_path: P, cli_runner: RunnerFunc):
     """
     Trying to delete a component that does not exist results in a non-0 exit
     code.
@@ -396,25 +404,23 @@ def test_deleting_inexistant_component(tmp_path: P):
     setup_directory(tmp_path)
     component_name = "i-dont-exist"
 
-    exit_status = call(
-        f"commodore -d {tmp_path} -vvv component delete --force {component_name}",
-        shell=True,
+    result = cli_runner(
+        ["-d", str(tmp_path), "-vvv", "component", "delete", "--force", component_name]
     )
-    assert exit_status == 2
+    assert result.exit_code == 2
 
 
-def test_check_golden_diff(tmp_path: P):
+def test_check_golden_diff(tmp_path: P, cli_runner: RunnerFunc):
     """
     Verify that `make golden-diff` passes for a component which has golden tests enabled
     """
     setup_directory(tmp_path)
 
     component_name = "test-component"
-    exit_status = call(
-        f"commodore -d {tmp_path} -vvv component new {component_name}",
-        shell=True,
+    result = cli_runner(
+        ["-d", str(tmp_path), "-vvv", "component", "new", component_name]
     )
-    assert exit_status == 0
+    assert result.exit_code == 0
 
     # Override component Makefile COMMODORE_CMD to use the local Commodore binary
     env = os.environ
@@ -954,3 +960,46 @@ def test_component_templater_read_from_modulesync_config(
 
     assert t.cookiecutter_args["copyright_holder"] == expected_holder
     assert t.cookiecutter_args["copyright_year"] == expected_year
+
+
+def test_read_remote_url(tmp_path: P):
+    repo = Repo.init(tmp_path / "repo")
+    repo.create_remote("origin", "https://git.example.com/component-test.git")
+    repo.index.commit("Initial commit")
+    repo.git.worktree("add", str(tmp_path / "worktree"))
+
+    assert (
+        template._read_remote_url(tmp_path / "repo")
+        == "https://git.example.com/component-test.git"
+    )
+    assert (
+        template._read_remote_url(tmp_path / "worktree")
+        == "https://git.example.com/component-test.git"
+    )
+
+
+@pytest.mark.parametrize(
+    "config_snippet",
+    [
+        # Quoted value with inline comment
+        '[remote "origin"]\n\turl = "https://git.example.com/quoted.git" ; comment\n',
+        # Unquoted value with inline comment
+        '[remote "origin"]\n\turl = https://git.example.com/comment.git # comment\n',
+        # URL overridden through an included config file
+        "[include]\n\tpath = included.gitconfig\n",
+        '[includeIf "gitdir:/"]\n\tpath = included.gitconfig\n',
+    ],
+)
+def test_read_remote_url_fallback(tmp_path: P, config_snippet: str):
+    repo = Repo.init(tmp_path / "repo")
+    repo.create_remote("origin", "https://git.example.com/component-test.git")
+    (tmp_path / "repo" / ".git" / "included.gitconfig").write_text(
+        '[remote "origin"]\n\turl = https://git.example.com/included.git\n',
+        encoding="utf-8",
+    )
+    with open(tmp_path / "repo" / ".git" / "config", "a", encoding="utf-8") as f:
+        f.write(config_snippet)
+
+    expected = repo.git.config("--get", "remote.origin.url")
+    assert expected != "https://git.example.com/component-test.git"
+    assert template._read_remote_url(tmp_path / "repo") == expected
@@ -14,6 +14,7 @@ import jwt
 import pytest
 import responses
 
+from commodore import tokencache
 from commodore.config import (
     Config,
     set_fact_value,
@@ -163,9 +164,47 @@ def test_register_component_deprecations(config, params, expected):
 
     config.register_component_deprecations(params)
 
-    assert len(expected) == len(config._deprecation_notices)
-    for en, an in zip(sorted(expected), sorted(config._deprecation_notices)):
-        assert en == an
+    assert expected == list(config._deprecation_notices)
+
+
+def test_register_component_deprecations_multiple_aliases(config):
+    alias_data = {"bar": "bar", "baz": "bar", "qux": "bar"}
+    config.register_component_aliases(alias_data)
+    params = {"bar": {"namespace": "syn-bar", "_metadata": {"deprecated": True}}}
+
+    config.register_component_deprecations(params)
+
+    assert list(config._deprecation_notices) == ["Component bar is deprecated."]
+
+
+def test_check_component_metadata(config):
+    alias_data = {"bar": "bar", "baz": "bar", "foo": "foo"}
+    config.register_component_aliases(alias_data)
+    params = {
+        "bar": {"_metadata": {"multi_instance": True, "deprecated": True}},
+        "foo": {"_metadata": {"deprecated": True, "replaced_by": "bar"}},
+    }
+
+    config.check_component_metadata(params)
+
+    assert list(config._deprecation_notices) == [
+        "Component bar is deprecated.",
+        "Component foo is deprecated. Use component bar instead.",
+    ]
+
+
+def test_check_component_metadata_error(config):
+    alias_data = {"baz": "bar"}
+    config.register_component_aliases(alias_data)
+    params = {"bar": {"_metadata": {"deprecated": True}}}
+
+    with pytest.raises(click.ClickException) as e:
+        config.check_component_metadata(params)
+
+    assert "Component bar with alias baz does not support instantiation." in str(
+        e.value
+    )
+    assert len(config._deprecation_notices) == 0
 
 
 def _setup_deprecation_notices(config):
@@ -176,7 +215,14 @@ def _setup_deprecation_notices(config):
 def test_register_deprecation_notices(config):
     _setup_deprecation_notices(config)
 
-    assert ["test 1", "test 2"] == config._deprecation_notices
+    assert ["test 1", "test 2"] == list(config._deprecation_notices)
+
+
+def test_register_deprecation_notices_deduplicates(config):
+    _setup_deprecation_notices(config)
+    _setup_deprecation_notices(config)
+
+    assert ["test 1", "test 2"] == list(config._deprecation_notices)
 
 
 def test_print_deprecation_notices_no_notices(config, capsys):
@@ -202,23 +248,21 @@ def test_print_deprecation_notices(config, capsys):
     )
 
 
+# Tokens returned by `mock_get_token()`, encoded once at import time. The valid
+# token expires far in the future, the expired token's `exp` is the epoch.
+_CACHED_VALID_TOKEN = jwt.encode(
+    {"exp": time.time() + 1e9, "from_cache": True}, "secret", algorithm="HS256"
+)
+_CACHED_EXPIRED_TOKEN = jwt.encode(
+    {"exp": 0, "from_cache": True}, "secret", algorithm="HS256"
+)
+
+
 def mock_get_token(url: str) -> Optional[str]:
     if url == "https://syn.example.com":
-        return {
-            "id_token": jwt.encode(
-                {"exp": time.time() + 100, "from_cache": True},
-                "secret",
-                algorithm="HS256",
-            )
-        }
+        return {"id_token": _CACHED_VALID_TOKEN}
     elif url == "https://expired.example.com":
-        return {
-            "id_token": jwt.encode(
-                {"exp": time.time() - 100, "from_cache": True},
-                "secret",
-                algorithm="HS256",
-            )
-        }
+        return {"id_token": _CACHED_EXPIRED_TOKEN}
 
     else:
         return None
@@ -228,9 +272,7 @@ def mock_get_token(url: str) -> Optional[str]:
 def test_use_token_cache(test_patch):
     test_patch.side_effect = mock_get_token
     conf = Config(P("."), api_url="https://syn.example.com")
-    t = jwt.decode(
-        conf.api_token, algorithms=["RS256"], options={"verify_signature": False}
-    )
+    t = tokencache.peek_claims(conf.api_token)
     assert t["from_cache"]
 
 
@@ -241,6 +283,44 @@ def test_expired_token_cache(test_patch):
     assert conf.api_token is None
 
 
+@patch("commodore.tokencache.get")
+def test_expired_token_cache_decodes_once(test_patch):
+    test_patch.return_value = mock_get_token("https://expired.example.com")
+    conf = Config(P("."), api_url="https://expired.example.com")
+    tokencache._decode_claims.cache_clear()
+    with patch("jwt.decode", wraps=jwt.decode) as decode:
+        # Cold cache
+        assert conf.api_token is None
+        # Warm cache, the expiry is still checked against the current time
+        assert conf.api_token is None
+
+    decode.assert_called_once()
+
+
+def test_api_token_from_file(tmp_path: P):
+    token_file = tmp_path / "token"
+    token_file.write_text("file-token\n", encoding="utf-8")
+
+    conf = Config(P("."), api_token=str(token_file))
+    assert conf.api_token == "file-token"
+
+
+@pytest.mark.parametrize(
+    "token",
+    [
+        jwt.encode({"sub": "commodore"}, "secret", algorithm="HS256"),
+        "a" * 300,
+        "multi\nline",
+    ],
+)
+def test_api_token_literal(token: str):
+    with patch("pathlib.Path.is_file") as is_file:
+        conf = Config(P("."), api_token=token)
+
+    is_file.assert_not_called()
+    assert conf.api_token == token.strip()
+
+
 def test_register_get_package(config: Config, tmp_path: P, mockdep):
     # No preregistered packages
     assert config.get_packages() == {}
@@ -344,6 +424,7 @@ def test_set_fact_value(
         ("json:1", 1),
         ('json:["a"]', ["a"]),
         ('json:{"test":{"key":"value"}}', {"test": {"key": "value"}}),
+        ("json:Infinity", float("inf")),
     ],
 )
 def test_parse_dynamic_fact_value(value: str, expected: Any):
@@ -433,3 +514,29 @@ def test_config_discover_oidc_config(
 
     assert c.oidc_client == expected_client
     assert c.oidc_discovery_url == expected_url
+
+
+def test_config_work_dir(tmp_path: P):
+    # Resolve `tmp_path` itself, in case it has a symlinked parent
+    tmp_path = tmp_path.resolve()
+    (tmp_path / "work").mkdir()
+    (tmp_path / "link").symlink_to(tmp_path / "work")
+    (tmp_path / "real" / "work").mkdir(parents=True)
+    (tmp_path / "parent").symlink_to(tmp_path / "real")
+
+    assert Config(tmp_path / "work").work_dir == tmp_path / "work"
+    assert Config(tmp_path / "link").work_dir == tmp_path / "work"
+    assert Config(tmp_path / "link" / ".." / "work").work_dir == tmp_path / "work"
+    assert Config(tmp_path / "parent" / "work").work_dir == tmp_path / "real" / "work"
+    assert Config(P(".")).work_dir == P(".").resolve()
+
+
+def test_config_inventory_work_dir(tmp_path: P):
+    c = Config(tmp_path)
+    c.work_dir = tmp_path / "a"
+    assert c.inventory.work_dir == tmp_path / "a"
+
+    inv = c.inventory
+    c.work_dir = tmp_path / "b"
+    assert c.inventory is inv
+    assert inv.work_dir == tmp_path / "b"
@@ -139,7 +139,7 @@ def _setup_mock_inventory(patch_inventory, aliases={}, packages=[], omit_version
         "nodes": nodes,
     }
 
-    def inv(inventory_dir, key="nodes", ignore_class_notfound=False):
+    def inv(inventory_dir, key="nodes", ignore_class_notfound=False, cached=False):
         return mock_inventory[key]
 
     patch_inventory.side_effect = inv
@@ -173,3 +173,12 @@ def test_read_packages(
         pkg_names,
     )
     assert pspecs == expected
+
+
+@pytest.mark.parametrize("path", ["baz", "/baz", "//baz"])
+def test_dependency_spec_parse_strips_leading_slashes(path: str):
+    spec = version_parsing.DependencySpec.parse(
+        {"url": "https://git.example.com/barbaz.git", "version": "master", "path": path}
+    )
+
+    assert spec.path == "baz"
@@ -3,6 +3,7 @@ from __future__ import annotations
 import datetime
 import difflib
 import json
+import shutil
 
 from pathlib import Path
 from typing import Union
@@ -15,7 +16,7 @@ import pytest
 import responses
 import yaml
 
-from conftest import RunnerFunc
+from conftest import RunnerFunc, SafeDumper
 from test_package import _setup_package_remote
 from test_package_template import call_package_new
 
@@ -26,8 +27,35 @@ from commodore.package.template import PackageTemplater
 
 from commodore import dependency_syncer
 
+pytestmark = pytest.mark.usefixtures("git_test_env")
+
 DATA_DIR = Path(__file__).parent.absolute() / "testdata" / "github"
 
+
+def _load_gh_response(name: str):
+    with open(DATA_DIR / f"projectsyn-package-foo-{name}.json", encoding="utf-8") as f:
+        return json.load(f)
+
+
+# GitHub API responses, loaded once. Helpers which need to adjust a response must
+# not modify these objects, but create an updated copy instead.
+GH_REPO_RESP = _load_gh_response("response")
+GH_PULLS_RESP = _load_gh_response("response-pulls")
+GH_PR_RESP = _load_gh_response("response-pr")
+GH_ISSUE_COMMENT_RESP = _load_gh_response("response-issue-comment")
+GH_ISSUE_RESP = _load_gh_response("response-issue")
+GH_LABEL_RESP = [
+    {
+        "id": 4405096203,
+        "node_id": "LA_kwDOHyQSds8AAAABBpBvCw",
+        "url": "https://api.github.com/repos/projectsyn/package-foo/labels/template-sync",
+        "name": "template-sync",
+        "color": "ededed",
+        "default": False,
+        "description": None,
+    }
+]
+
 GH_404_RESP = {
     "message": "Not Found",
     "documentation_url": "https://docs.github.com/rest/reference/repos#get-a-repository",
@@ -37,18 +65,54 @@ GH_404_RESP = {
 def create_pkg_list(tmp_path: Path, additional_packages: list[str] = []) -> Path:
     pkg_list = tmp_path / "pkgs.yaml"
     with open(pkg_list, "w", encoding="utf-8") as f:
-        yaml.safe_dump(["projectsyn/package-foo"] + additional_packages, f)
+        yaml.dump(
+            ["projectsyn/package-foo"] + additional_packages, f, Dumper=SafeDumper
+        )
 
     return pkg_list
 
 
+@pytest.fixture(scope="session")
+def foo_package_remote_cache(tmp_path_factory) -> Path:
+    rpath = tmp_path_factory.mktemp("foo-remote") / "foo.git"
+    _setup_package_remote("foo", rpath)
+    return rpath
+
+
+@pytest.fixture
+def foo_package_remote(tmp_path: Path, foo_package_remote_cache: Path) -> Path:
+    """
+    Setup package `foo` remote repo in `tmp_path`
+
+    The remote repo is only created once per session, each test gets its own copy
+    which it can freely modify.
+    """
+    rpath = tmp_path / "foo.git"
+    shutil.copytree(foo_package_remote_cache, rpath, symlinks=True)
+    return rpath
+
+
+@pytest.fixture
+def gh_client(config: Config) -> github.Github:
+    """
+    Setup GitHub client with the fake token expected by the mocked API responses
+
+    Tests must register the mocked API responses before calling the client. The
+    client doesn't retry requests and uses a short timeout, so that unexpected
+    requests fail fast.
+    """
+    config.github_token = "ghp_fake-token"
+    return github.Github(config.github_token, retry=0, timeout=1)
+
+
 @pytest.mark.parametrize("sync_branch", ["none", "local", "remote"])
-def test_ensure_branch(tmp_path: Path, config: Config, sync_branch: str):
-    _setup_package_remote("foo", tmp_path / "foo.git")
+def test_ensure_branch(
+    tmp_path: Path, config: Config, foo_package_remote: Path, sync_branch: str
+):
     if sync_branch == "remote":
-        r = git.Repo(tmp_path / "foo.git")
+        r = git.Repo(foo_package_remote)
         r.create_head("template-sync")
-    p = Package.clone(config, f"file://{tmp_path}/foo.git", "foo")
+    p = Package.clone(config, f"file://{foo_package_remote}", "foo")
     if sync_branch == "local":
         orig_head = p.repo.repo.head
         p.repo.repo.create_head("template-sync")
@@ -56,8 +120,7 @@ def test_ensure_branch(tmp_path: Path, config: Config, sync_branch: str):
         p.checkout()
         assert p.repo.repo.head == orig_head
 
-    with open(p.target_dir / "test.txt", "w", encoding="utf-8") as f:
-        f.write("Hello, world\n")
+    (p.target_dir / "test.txt").write_text("Hello, world\n", encoding="utf-8")
     p.repo.commit("Add test.txt")
 
     r = p.repo.repo
@@ -73,9 +136,10 @@ def test_ensure_branch(tmp_path: Path, config: Config, sync_branch: str):
     assert h.commit.message == "Add test.txt"
 
 
-def test_ensure_branch_no_repo(tmp_path: Path, config: Config):
-    _setup_package_remote("foo", tmp_path / "foo.git")
-    clone_url = f"file://{tmp_path}/foo.git"
+def test_ensure_branch_no_repo(
+    tmp_path: Path, config: Config, foo_package_remote: Path
+):
+    clone_url = f"file://{foo_package_remote}"
     dep = config.register_dependency_repo(clone_url)
     p = Package("foo", dep, tmp_path / "pkg.foo")
 
@@ -88,29 +152,22 @@ def test_ensure_branch_no_repo(tmp_path: Path, config: Config):
 API_TOKEN_MATCHER = responses.matchers.header_matcher(
     {"Authorization": "token ghp_fake-token"}
 )
+PR_UPDATE_BODY_MATCHER = responses.matchers.json_params_matcher({"body": ""})
 
 
 def _setup_gh_get_responses(has_open_pr: bool, clone_url: str = ""):
+    resp = GH_REPO_RESP
+    if clone_url:
+        resp = {**resp, "clone_url": clone_url}
+    responses.add(
+        responses.GET,
+        "https://api.github.com:443/repos/projectsyn/package-foo",
+        status=200,
+        json=resp,
+        match=[API_TOKEN_MATCHER],
+    )
 
-    with open(DATA_DIR / "projectsyn-package-foo-response.json", encoding="utf-8") as f:
-        resp = json.load(f)
-        if clone_url:
-            resp["clone_url"] = clone_url
-        responses.add(
-            responses.GET,
-            "https://api.github.com:443/repos/projectsyn/package-foo",
-            status=200,
-            json=resp,
-            match=[API_TOKEN_MATCHER],
-        )
-
-    if has_open_pr:
-        with open(
-            DATA_DIR / "projectsyn-package-foo-response-pulls.json", encoding="utf-8"
-        ) as f:
-            pulls = json.load(f)
-    else:
-        pulls = []
+    pulls = GH_PULLS_RESP if has_open_pr else []
     responses.add(
         responses.GET,
         "https://api.github.com:443/repos/projectsyn/package-foo/pulls",
@@ -158,10 +215,10 @@ def labels_post_body_match(request) -> tuple[bool, str]:
 
 
 def _setup_gh_pr_response(method, pr_body=""):
-    with open(
-        DATA_DIR / "projectsyn-package-foo-response-pr.json", encoding="utf-8"
-    ) as f:
-        resp = json.load(f)
+    if method == responses.PATCH:
+        suffix = "/1"
+        body_matcher = PR_UPDATE_BODY_MATCHER
+    else:
         suffix = ""
         body_matcher = responses.matchers.json_params_matcher(
             {
@@ -172,34 +229,19 @@ def _setup_gh_pr_response(method, pr_body=""):
                 "head": "template-sync",
             }
         )
-        if method == responses.PATCH:
-            suffix = "/1"
-            body_matcher = responses.matchers.json_params_matcher({"body": ""})
-        responses.add(
-            method,
-            f"https://api.github.com:443/repos/projectsyn/package-foo/pulls{suffix}",
-            json=resp,
-            status=200,
-            match=[API_TOKEN_MATCHER, body_matcher],
-        )
+    responses.add(
+        method,
+        f"https://api.github.com:443/repos/projectsyn/package-foo/pulls{suffix}",
+        json=GH_PR_RESP,
+        status=200,
+        match=[API_TOKEN_MATCHER, body_matcher],
+    )
 
     # With customizable labels we also update labels when editing existing PRs
-    label_resp = [
-        {
-            "id": 4405096203,
-            "node_id": "LA_kwDOHyQSds8AAAABBpBvCw",
-            "url": "https://api.github.com/repos/projectsyn/package-foo/labels/template-sync",
-            "name": "template-sync",
-            "color": "ededed",
-            "default": False,
-            "description": None,
-        }
-    ]
-
     responses.add(
         responses.POST,
         "https://api.github.com:443/repos/projectsyn/package-foo/issues/1/labels",
-        json=label_resp,
+        json=GH_LABEL_RESP,
         status=200,
         match=[API_TOKEN_MATCHER, labels_post_body_match],
     )
@@ -207,12 +249,7 @@ def _setup_gh_pr_response(method, pr_body=""):
 
 def _setup_gh_pr_comment_responses(body: str):
     # Add POST response for issue comment
-    with open(
-        DATA_DIR / "projectsyn-package-foo-response-issue-comment.json",
-        encoding="utf-8",
-    ) as f:
-        comment = json.load(f)
-        comment["body"] = body
+    comment = {**GH_ISSUE_COMMENT_RESP, "body": body}
     responses.add(
         responses.POST,
         "https://api.github.com:443/repos/projectsyn/package-foo/issues/1/comments",
@@ -224,15 +261,10 @@ def _setup_gh_pr_comment_responses(body: str):
         ],
     )
     # Add issue Get response for `pr.as_issue()`
-    with open(
-        DATA_DIR / "projectsyn-package-foo-response-issue.json",
-        encoding="utf-8",
-    ) as f:
-        issue = json.load(f)
     responses.add(
         responses.GET,
         "https://api.github.com:443/repos/projectsyn/package-foo/issues/1",
-        json=issue,
+        json=GH_ISSUE_RESP,
         status=200,
         match=[API_TOKEN_MATCHER],
     )
@@ -240,17 +272,20 @@ def _setup_gh_pr_comment_responses(body: str):
 
 @responses.activate
 @pytest.mark.parametrize("pr_exists", [True, False])
-def test_ensure_pr(tmp_path: Path, config: Config, pr_exists: bool):
+def test_ensure_pr(
+    tmp_path: Path,
+    config: Config,
+    foo_package_remote: Path,
+    gh_client: github.Github,
+    pr_exists: bool,
+):
     _setup_gh_get_responses(pr_exists)
     _setup_gh_pr_response(responses.PATCH if pr_exists else responses.POST)
-    _setup_package_remote("foo", tmp_path / "foo.git")
-    config.github_token = "ghp_fake-token"
-    p = Package.clone(config, f"file://{tmp_path}/foo.git", "foo")
+    p = Package.clone(config, f"file://{foo_package_remote}", "foo")
     pname = "projectsyn/package-foo"
     dependency_syncer.ensure_branch(p, "template-sync")
 
-    gh = github.Github(config.github_token)
-    gr = gh.get_repo(pname)
+    gr = gh_client.get_repo(pname)
 
     msg = dependency_syncer.ensure_pr(
         p, pname, gr, "template-sync", ["template-sync"], ""
@@ -264,7 +299,13 @@ def test_ensure_pr(tmp_path: Path, config: Config, pr_exists: bool):
 
 @pytest.mark.parametrize("pr_exists", [False, True])
 @responses.activate
-def test_ensure_pr_no_permission(tmp_path: Path, config: Config, pr_exists: bool):
+def test_ensure_pr_no_permission(
+    tmp_path: Path,
+    config: Config,
+    foo_package_remote: Path,
+    gh_client: github.Github,
+    pr_exists: bool,
+):
     _setup_gh_get_responses(pr_exists)
     if pr_exists:
         responses.add(
@@ -281,14 +322,11 @@ def test_ensure_pr_no_permission(tmp_path: Path, config: Config, pr_exists: bool
             status=404,
         )
 
-    _setup_package_remote("foo", tmp_path / "foo.git")
-    config.github_token = "ghp_fake-token"
-    p = Package.clone(config, f"file://{tmp_path}/foo.git", "foo")
+    p = Package.clone(config, f"file://{foo_package_remote}", "foo")
     pname = "projectsyn/package-foo"
     dependency_syncer.ensure_branch(p, "template-sync")
 
-    gh = github.Github(config.github_token)
-    gr = gh.get_repo(pname)
+    gr = gh_client.get_repo(pname)
 
     msg = dependency_syncer.ensure_pr(p, pname, gr, "template-sync", [], "")
 
@@ -300,9 +338,8 @@ def test_ensure_pr_no_permission(tmp_path: Path, config: Config, pr_exists: bool
     )
 
 
-def test_ensure_pr_no_repo(tmp_path: Path, config: Config):
-    _setup_package_remote("foo", tmp_path / "foo.git")
-    clone_url = f"file://{tmp_path}/foo.git"
+def test_ensure_pr_no_repo(tmp_path: Path, config: Config, foo_package_remote: Path):
+    clone_url = f"file://{foo_package_remote}"
     dep = config.register_dependency_repo(clone_url)
     p = Package("foo", dep, tmp_path / "pkg.foo")
     gr = None
@@ -314,18 +351,17 @@ def test_ensure_pr_no_repo(tmp_path: Path, config: Config):
 
 
 @responses.activate
-def test_ensure_pr_comment(tmp_path: Path, config: Config):
+def test_ensure_pr_comment(
+    tmp_path: Path, config: Config, foo_package_remote: Path, gh_client: github.Github
+):
     _setup_gh_get_responses(False)
     _setup_gh_pr_response(responses.POST)
     _setup_gh_pr_comment_responses("Test comment 123")
-    _setup_package_remote("foo", tmp_path / "foo.git")
-    config.github_token = "ghp_fake-token"
-    p = Package.clone(config, f"file://{tmp_path}/foo.git", "foo")
+    p = Package.clone(config, f"file://{foo_package_remote}", "foo")
     pname = "projectsyn/package-foo"
     dependency_syncer.ensure_branch(p, "template-sync")
 
-    gh = github.Github(config.github_token)
-    gr = gh.get_repo(pname)
+    gr = gh_client.get_repo(pname)
 
     msg = dependency_syncer.ensure_pr(
         p, pname, gr, "template-sync", ["template-sync"], "Test comment 123"
@@ -400,6 +436,7 @@ def test_sync_packages(
     tmp_path: Path,
     cli_runner: RunnerFunc,
     config: Config,
+    commodore_config_package_template: Path,
     dry_run: bool,
     second_pkg: bool,
     needs_update: bool,
@@ -412,10 +449,7 @@ def test_sync_packages(
     _setup_gh_get_responses(False, clone_url=remote_url)
 
     # Get template latest commit sha
-    tpl = git.Repo.clone_from(
-        "https://github.com/projectsyn/commodore-config-package-template.git",
-        tmp_path / "template.git",
-    )
+    tpl = git.Repo(commodore_config_package_template)
     tpl_head_name = tpl.head.reference.name
     tpl_head_short = tpl.head.commit.hexsha[:7]
 
@@ -433,14 +467,13 @@ def test_sync_packages(
     r.repo.remote().set_url(remote_url)
 
     if needs_update:
-        with open(pkg_path / ".cruft.json", "r", encoding="utf-8") as f:
-            cruft_json = json.load(f)
+        cruft_json_path = pkg_path / ".cruft.json"
+        cruft_json = json.loads(cruft_json_path.read_text(encoding="utf-8"))
 
         # Adjust template version, so sync has something to update
         cruft_json["checkout"] = "main"
         # Write back adjusted .cruft.json and amend initial commit
-        with open(pkg_path / ".cruft.json", "w", encoding="utf-8") as f:
-            json.dump(cruft_json, f, indent=2)
+        cruft_json_path.write_text(json.dumps(cruft_json, indent=2), encoding="utf-8")
         r.stage_files([".cruft.json"])
         r.commit("Initial commit", amend=True)
         r.push()
@@ -507,8 +540,7 @@ def test_sync_packages_skip(tmp_path: Path, config: Config, capsys):
     _setup_gh_get_responses(False, clone_url=f"file://{pkg_dir}")
 
     # setup non-package repo
-    with open(pkg_dir / "test.txt", "w", encoding="utf-8") as f:
-        f.write("Hello, world!\n")
+    (pkg_dir / "test.txt").write_text("Hello, world!\n", encoding="utf-8")
     r = git.Repo.init(pkg_dir)
     r.index.add("test.txt")
     r.index.commit("Initial commit")
@@ -675,7 +707,7 @@ def test_read_dependency_list(
 ):
     listf = tmp_path / "deps.yaml"
     with open(listf, "w", encoding="utf-8") as f:
-        yaml.safe_dump(deps, f)
+        yaml.dump(deps, f, Dumper=SafeDumper)
 
     computed = dependency_syncer.read_dependency_list(listf, filter)
 
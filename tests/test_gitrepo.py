@@ -569,6 +569,16 @@ def test_gitrepo_commit_amend(tmp_path: Path):
     assert r.repo.head.commit.committer.email == "john.doe@example.com"
 
 
+_MERGE_CONFLICT_DIFF = b"""diff --git a/test.txt b/test.txt
+new file mode 100644
+index 0000000..d56c457
+--- /dev/null
++++ b/test.txt
+@@ -0,0 +1 @@
++Yo World!
+"""
+
+
 def _setup_merge_conflict(tmp_path: Path):
     r, _ = setup_repo(tmp_path)
     test_txt_path = r.working_tree_dir / "test.txt"
@@ -578,17 +588,13 @@ def _setup_merge_conflict(tmp_path: Path):
     r.commit("Add content to test.txt")
     assert not r.repo.is_dirty()
 
-    diff = """diff --git a/test.txt b/test.txt
-new file mode 100644
-index 0000000..d56c457
---- /dev/null
-+++ b/test.txt
-@@ -0,0 +1 @@
-+Yo World!
-"""
-
     result = subprocess.run(
-        ["git", "apply", "-3"], input=diff.encode(), cwd=r.working_tree_dir
+        ["git", "apply", "-3"],
+        input=_MERGE_CONFLICT_DIFF,
+        cwd=r.working_tree_dir,
+        check=False,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
     )
     # patch should not apply
     assert result.returncode == 1
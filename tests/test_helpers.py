@@ -145,6 +145,14 @@ def test_yaml_dump_all(tmp_path: Path, input, expected):
     _test_yaml_dump_fun(helpers.yaml_dump_all, tmp_path, input, expected)
 
 
+def test_yaml_load_first():
+    # The third document is invalid YAML, but we never parse it
+    data = b"a: 1\n---\nb: 2\n---\n\tinvalid\n"
+
+    assert helpers.yaml_load_first(data, 1) == [{"a": 1}]
+    assert helpers.yaml_load_first(data, 2) == [{"a": 1}, {"b": 2}]
+
+
 @pytest.mark.parametrize(
     "sequence,winsize,expected",
     [
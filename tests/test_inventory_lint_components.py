@@ -187,6 +187,23 @@ def test_lint_skip_file(
     assert expected_debug_msg in captured.out
 
 
+def test_lint_file_without_parameters_not_parsed(
+    tmp_path: Path, capsys, config: Config, monkeypatch
+):
+    testf = tmp_path / "test.yml"
+    yaml_dump({"a": 1}, testf)
+
+    def _fail_load(*args, **kwargs):
+        raise AssertionError("file without key `parameters` should not be parsed")
+
+    monkeypatch.setattr(lint, "yaml_load_first", _fail_load)
+
+    ec = lint.ComponentSpecLinter()(config, testf)
+
+    captured = capsys.readouterr()
+    _check_lint_result(ec, 0, captured)
+
+
 def _setup_directory(tmp_path: Path):
     lint_direntries = [
         tmp_path / "test.yml",
@@ -231,6 +248,27 @@ def test_lint_directory(tmp_path: Path, capsys, config: Config):
     _check_lint_result(ec, expected_errcount, captured)
 
 
+def test_lint_directory_parallel(tmp_path: Path, capsys, config: Config):
+    expected_errcount = _setup_directory(tmp_path)
+
+    ec = lint.ComponentSpecLinter()(config, tmp_path, jobs=2)
+
+    captured = capsys.readouterr()
+    _check_lint_result(ec, expected_errcount, captured)
+
+
+def test_lint_directory_skips_non_yaml_files(tmp_path: Path, capsys, config: Config):
+    yaml_dump(
+        {"parameters": {"components": {"c1": {"url": "https://example.com/c1.git"}}}},
+        tmp_path / "test.txt",
+    )
+
+    ec = lint.ComponentSpecLinter()(config, tmp_path)
+
+    captured = capsys.readouterr()
+    _check_lint_result(ec, 0, captured)
+
+
 def test_lint_components_file(tmp_path: Path, config: Config, capsys):
     filecontents = {
         "parameters": {
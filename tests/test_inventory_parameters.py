@@ -2,88 +2,30 @@ from __future__ import annotations
 
 import os
 import pytest
-import random
 from pathlib import Path
 from typing import Optional
 
 from commodore.inventory import parameters
 from commodore.helpers import yaml_dump
 
+from conftest import (
+    CLOUD_REGION_PARAMS,
+    DIST_PARAMS,
+    GLOBAL_PARAMS,
+    setup_global_repo_dir,
+)
 
-GLOBAL_PARAMS = {
-    "components": {
-        "tc1": {
-            "url": "tc1",
-            "version": "gp",
-        },
-        "tc2": {
-            "url": "tc2",
-            "version": "gp",
-        },
-        "tc3": {
-            "url": "tc3",
-            "version": "gp",
-        },
-        "tc4": {
-            "url": "tc4",
-            "version": "gp",
-        },
-        "tc5": {
-            "url": "tc5",
-            "version": "gp",
-        },
-    }
-}
-
-DIST_PARAMS = {
-    "a": {
-        "components": {
-            "tc1": {"version": "a_version"},
-        },
-    },
-    "b": {
-        "components": {
-            "tc2": {"url": "b_url"},
-        },
-    },
-    "c": {"other_key": {}},
-    "d": {"test": "testing"},
-    # Test that multi-instance related params work correctly
-    "e": {"namespace": "${_instance}"},
-}
-
-CLOUD_REGION_PARAMS = {
-    "x": {
-        "components": {
-            "tc1": {"version": "x_version"},
-        },
-    },
-    "y": [
-        (
-            "params",
-            {
-                "components": {
-                    "tc1": {"url": "y_params_url", "version": "y_params_version"},
-                }
-            },
-        ),
-        ("m", {"components": {"tc4": {"url": "y_m_url"}}}),
-        ("n", {"components": {"tc4": {"version": "y_n_version"}}}),
-        ("o", {}),
-    ],
-    "z": [("a", {})],
-}
 
 # Generate a list of tuples (cloud, region) from the CLOUD_REGION_PARAMS map, this
 # allows us to parametrize the cloud region reclass test in such a way that it only
 # tests valid combinations of cloud and region.
-CLOUD_REGION_TESTCASES = [
-    (cloud, region[0])
+CLOUD_REGION_TESTCASES = tuple(
+    (cloud, r[0])
     for cloud, regions in CLOUD_REGION_PARAMS.items()
-    for region in regions
     if isinstance(regions, list)
-    if region[0] != "params"
-]
+    for r in regions
+    if r[0] != "params"
+)
 
 CLUSTER_PARAMS = {
     "common": {
@@ -97,74 +39,6 @@ CLUSTER_PARAMS = {
 }
 
 
-def setup_global_repo_dir(
-    tmp_path: Path, global_params, distparams, cloud_region_params
-) -> Path:
-    global_path = tmp_path / "global-defaults"
-    os.makedirs(global_path)
-    os.makedirs(global_path / "distribution", exist_ok=True)
-    os.makedirs(global_path / "cloud", exist_ok=True)
-    ext = [".yml", ".yaml"]
-    for distribution, params in distparams.items():
-        # randomize extensions for distribution classes
-        fext = random.choice(ext)
-        yaml_dump(
-            {"parameters": params},
-            global_path / "distribution" / f"{distribution}{fext}",
-        )
-    for cloud, params in cloud_region_params.items():
-        if isinstance(params, dict):
-            yaml_dump({"parameters": params}, global_path / "cloud" / f"{cloud}.yml")
-        else:
-            assert isinstance(params, list)
-            os.makedirs(global_path / "cloud" / cloud, exist_ok=True)
-            rparams = {}
-            for region, params in params:
-                if region == "params":
-                    rparams = params
-                    continue
-                yaml_dump(
-                    {"parameters": params},
-                    global_path / "cloud" / cloud / f"{region}.yml",
-                )
-            # Write cloud-level params
-            yaml_dump(
-                {"parameters": rparams},
-                global_path / "cloud" / cloud / "params.yml",
-            )
-            # Configure cloud region hierarchy
-            yaml_dump(
-                {
-                    "classes": [
-                        f"global.cloud.{cloud}.params",
-                        f"global.cloud.{cloud}.${{facts:region}}",
-                    ],
-                },
-                global_path / "cloud" / f"{cloud}.yml",
-            )
-
-    # Write global params
-    yaml_dump(
-        {"parameters": global_params},
-        global_path / "params.yml",
-    )
-
-    # Write hierarchy config
-    yaml_dump(
-        {
-            "classes": [
-                "global.params",
-                "global.distribution.${facts:distribution}",
-                "global.cloud.${facts:cloud}",
-                "${cluster:tenant}.${cluster:name}",
-            ]
-        },
-        global_path / "commodore.yml",
-    )
-
-    return global_path
-
-
 def setup_tenant_repo_dir(tmp_path: Path, tenant_params) -> Path:
     tenant_path = tmp_path / "tenant-config"
     os.makedirs(tenant_path)
@@ -245,15 +119,10 @@ def get_component(
         tenantc = {}
         clusterc = {}
 
-    curl = clusterc.get(
-        "url", tenantc.get("url", rc.get("url", cc.get("url", dc.get("url", cn))))
-    )
-    cver = clusterc.get(
-        "version",
-        tenantc.get(
-            "version", rc.get("version", cc.get("version", dc.get("version", "gp")))
-        ),
-    )
+    # Parameters are ordered from most to least specific
+    hierarchy = (clusterc, tenantc, rc, cc, dc)
+    curl = next((c["url"] for c in hierarchy if "url" in c), cn)
+    cver = next((c["version"] for c in hierarchy if "version" in c), "gp")
 
     return {
         "url": curl,
@@ -392,15 +261,14 @@ def test_inventoryfactory_from_dirs(tmp_path: Path):
 
 
 @pytest.mark.parametrize("distribution", ["a", "b", "c", "d"])
-def test_inventoryfactory_reclass_distribution(tmp_path: Path, distribution: str):
-    global_dir = setup_global_repo_dir(
-        tmp_path, GLOBAL_PARAMS, DIST_PARAMS, CLOUD_REGION_PARAMS
-    )
+def test_inventoryfactory_reclass_distribution(
+    global_dir_full, tmp_path: Path, distribution: str
+):
     invfacts = create_inventory_facts(
-        tmp_path, global_dir, None, distribution, None, None
+        tmp_path, global_dir_full, None, distribution, None, None
     )
     invfactory = parameters.InventoryFactory.from_repo_dirs(
-        tmp_path, global_dir, None, invfacts
+        tmp_path, global_dir_full, None, invfacts
     )
 
     inv = invfactory.reclass(invfacts)
@@ -411,13 +279,12 @@ def test_inventoryfactory_reclass_distribution(tmp_path: Path, distribution: str
 
 
 @pytest.mark.parametrize("cloud", ["x", "y", "z"])
-def test_inventoryfactory_reclass_cloud(tmp_path: Path, cloud: str):
-    global_dir = setup_global_repo_dir(
-        tmp_path, GLOBAL_PARAMS, DIST_PARAMS, CLOUD_REGION_PARAMS
+def test_inventoryfactory_reclass_cloud(global_dir_full, tmp_path: Path, cloud: str):
+    invfacts = create_inventory_facts(
+        tmp_path, global_dir_full, None, None, cloud, None
     )
-    invfacts = create_inventory_facts(tmp_path, global_dir, None, None, cloud, None)
     invfactory = parameters.InventoryFactory.from_repo_dirs(
-        tmp_path, global_dir, None, invfacts
+        tmp_path, global_dir_full, None, invfacts
     )
 
     inv = invfactory.reclass(invfacts)
@@ -428,13 +295,14 @@ def test_inventoryfactory_reclass_cloud(tmp_path: Path, cloud: str):
 
 
 @pytest.mark.parametrize("cloud,region", CLOUD_REGION_TESTCASES)
-def test_inventoryfactory_reclass_cloud_region(tmp_path: Path, cloud: str, region: str):
-    global_dir = setup_global_repo_dir(
-        tmp_path, GLOBAL_PARAMS, DIST_PARAMS, CLOUD_REGION_PARAMS
+def test_inventoryfactory_reclass_cloud_region(
+    global_dir_full, tmp_path: Path, cloud: str, region: str
+):
+    invfacts = create_inventory_facts(
+        tmp_path, global_dir_full, None, None, cloud, region
     )
-    invfacts = create_inventory_facts(tmp_path, global_dir, None, None, cloud, region)
     invfactory = parameters.InventoryFactory.from_repo_dirs(
-        tmp_path, global_dir, None, invfacts
+        tmp_path, global_dir_full, None, invfacts
     )
 
     inv = invfactory.reclass(invfacts)
@@ -445,17 +313,16 @@ def test_inventoryfactory_reclass_cloud_region(tmp_path: Path, cloud: str, regio
 
 
 @pytest.mark.parametrize("cluster_id", CLUSTER_PARAMS.keys())
-def test_inventoryfactory_reclass_tenant(tmp_path: Path, cluster_id: str):
-    global_dir = setup_global_repo_dir(
-        tmp_path, GLOBAL_PARAMS, DIST_PARAMS, CLOUD_REGION_PARAMS
-    )
+def test_inventoryfactory_reclass_tenant(
+    global_dir_full, tmp_path: Path, cluster_id: str
+):
     tenant_dir = setup_tenant_repo_dir(tmp_path, CLUSTER_PARAMS)
 
     invfacts = create_inventory_facts(
-        tmp_path, global_dir, tenant_dir, "a", "y", "m", cluster_id, "t-foo"
+        tmp_path, global_dir_full, tenant_dir, "a", "y", "m", cluster_id, "t-foo"
     )
     invfactory = parameters.InventoryFactory.from_repo_dirs(
-        tmp_path, global_dir, tenant_dir, invfacts
+        tmp_path, global_dir_full, tenant_dir, invfacts
     )
     inv = invfactory.reclass(invfacts)
     components = inv.parameters("components")
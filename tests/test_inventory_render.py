@@ -5,14 +5,11 @@ import pytest
 from commodore.config import Config
 from commodore.inventory import render
 
+from conftest import DIST_PARAMS, GLOBAL_PARAMS
 from test_inventory_parameters import (
-    setup_global_repo_dir,
     setup_tenant_repo_dir,
     create_inventory_facts,
     verify_components,
-    GLOBAL_PARAMS,
-    DIST_PARAMS,
-    CLOUD_REGION_PARAMS,
     CLOUD_REGION_TESTCASES,
     CLUSTER_PARAMS,
 )
@@ -22,11 +19,13 @@ from test_inventory_parameters import (
 @pytest.mark.parametrize("cloud,region", CLOUD_REGION_TESTCASES)
 @pytest.mark.parametrize("cluster_id", [None] + list(CLUSTER_PARAMS.keys()))
 def test_extract_components(
-    tmp_path: Path, distribution: str, cloud: str, region: str, cluster_id: str
+    global_dir_full,
+    tmp_path: Path,
+    distribution: str,
+    cloud: str,
+    region: str,
+    cluster_id: str,
 ):
-    global_dir = setup_global_repo_dir(
-        tmp_path, GLOBAL_PARAMS, DIST_PARAMS, CLOUD_REGION_PARAMS
-    )
     if cluster_id:
         tenant_id = "t-foo"
         tenant_dir = setup_tenant_repo_dir(tmp_path, CLUSTER_PARAMS)
@@ -36,7 +35,7 @@ def test_extract_components(
     config = Config(tmp_path)
     invfacts = create_inventory_facts(
         tmp_path,
-        global_dir,
+        global_dir_full,
         tenant_dir,
         distribution,
         cloud,
@@ -74,11 +73,8 @@ def test_extract_components(
     ],
 )
 def test_extract_components_valueerror_on_invalid_args(
-    tmp_path: Path, invfacts, expected_error_msg
+    global_dir_full, tmp_path: Path, invfacts, expected_error_msg
 ):
-    global_dir = setup_global_repo_dir(
-        tmp_path, GLOBAL_PARAMS, DIST_PARAMS, CLOUD_REGION_PARAMS
-    )
     config = Config(tmp_path)
 
     with pytest.raises(
@@ -87,4 +83,4 @@ def test_extract_components_valueerror_on_invalid_args(
         + f"{expected_error_msg} "
         + "Verify the provided values or allow missing classes.",
     ):
-        render.extract_components(config, invfacts(tmp_path, global_dir))
+        render.extract_components(config, invfacts(tmp_path, global_dir_full))
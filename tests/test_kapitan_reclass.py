@@ -15,11 +15,19 @@ class MockInventory:
 class MockConfig:
     def __init__(self, invdir: P):
         self.inv = MockInventory(P(__file__).parent.absolute() / "testdata" / invdir)
+        self.cache = {}
 
     @property
     def inventory(self):
         return self.inv
 
+    @property
+    def inventory_cache(self):
+        return self.cache
+
+    def invalidate_inventory_cache(self):
+        self.cache = {}
+
 
 def test_yml_yaml(tmp_path: P):
     config = MockConfig(invdir="inventory_yml_yaml")
@@ -57,3 +65,23 @@ def test_relative_refs(tmp_path: P):
     assert "test" in inv["parameters"]
     assert "key1" in inv["parameters"]["test"]
     assert "value1" == inv["parameters"]["test"]["key1"]
+
+
+def test_cached_inventory(tmp_path: P):
+    config = MockConfig("inventory_apps")
+
+    inv = kapitan_inventory(config, cached=True)
+    assert "test" in inv
+    assert list(config.inventory_cache.keys()) == [False]
+
+    # cached calls reuse the rendered inventory, regardless of the requested key
+    assert kapitan_inventory(config, cached=True) is inv
+    apps = kapitan_inventory(config, key="applications", cached=True)
+    assert apps is config.inventory_cache[False]["applications"]
+    assert "app1" in apps
+
+    # uncached calls always render the inventory
+    assert kapitan_inventory(config) is not inv
+
+    config.invalidate_inventory_cache()
+    assert kapitan_inventory(config, cached=True) is not inv
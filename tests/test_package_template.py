@@ -4,6 +4,7 @@ from subprocess import call
 from datetime import date
 
 import json
+import os
 
 import click
 import git
@@ -14,7 +15,7 @@ from commodore.config import Config
 from commodore.gitrepo import GitRepo
 from commodore.package.template import PackageTemplater
 
-from conftest import RunnerFunc
+from conftest import RunnerFunc, SafeLoader
 
 
 def call_package_new(
@@ -101,8 +102,15 @@ def test_run_package_new_command(
 
     assert pkg_dir.is_dir()
     assert (pkg_dir / ".git").is_file() == (output_dir == "")
-    for f in expected_files:
-        assert (pkg_dir / f).is_file()
+    present = set()
+    for root, dirs, files in os.walk(pkg_dir):
+        # Don't descend into the package's Git directory
+        if ".git" in dirs:
+            dirs.remove(".git")
+        rel = Path(root).relative_to(pkg_dir)
+        present.update(rel / name for name in files)
+    missing = set(expected_files) - present
+    assert not missing, missing
 
     expected_cases = ["defaults"]
     for t in additional_test_cases:
@@ -110,7 +118,7 @@ def test_run_package_new_command(
             expected_cases.append(t)
 
     with open(pkg_dir / ".github" / "workflows" / "test.yaml") as gh_test:
-        workflows = yaml.safe_load(gh_test)
+        workflows = yaml.load(gh_test, Loader=SafeLoader)
         instances = workflows["jobs"]["test"]["strategy"]["matrix"]["instance"]
         assert instances == expected_cases
 
@@ -124,10 +132,11 @@ def test_run_package_new_command(
         ),
         ("00-invalid", "The package slug must match '^[a-z][a-z0-9-]+[a-z0-9]$'"),
         ("-invalid", "The package slug must match '^[a-z][a-z0-9-]+[a-z0-9]$'"),
-        ("-invalid", "The package slug must match '^[a-z][a-z0-9-]+[a-z0-9]$'"),
         ("invalid-", "The package slug must match '^[a-z][a-z0-9-]+[a-z0-9]$'"),
         ("Invalid", "The package slug must match '^[a-z][a-z0-9-]+[a-z0-9]$'"),
         ("p_invalid", "The package slug must match '^[a-z][a-z0-9-]+[a-z0-9]$'"),
+        ("ab", "The package slug must match '^[a-z][a-z0-9-]+[a-z0-9]$'"),
+        ("invalid\n", "The package slug must match '^[a-z][a-z0-9-]+[a-z0-9]$'"),
         ("t-invalid", "Package slug can't use reserved tenant prefix 't-'"),
         ("defaults", "Package can't use reserved slug 'defaults'"),
         ("components", "Package can't use reserved slug 'components'"),
@@ -142,6 +151,13 @@ def test_package_new_invalid_slug(config: Config, slug: str, expected: str):
     assert expected in str(e.value)
 
 
+def _make_jobs() -> int:
+    """Share the available CPUs between the pytest-xdist workers, so that parallel
+    `make` runs in concurrent tests don't oversubscribe the CPU."""
+    workers = int(os.environ.get("PYTEST_XDIST_WORKER_COUNT", "1"))
+    return max(1, (os.cpu_count() or 1) // workers)
+
+
 @pytest.mark.parametrize("golden", ["--golden-tests", "--no-golden-tests"])
 @pytest.mark.parametrize("additional_test_cases", [[], ["foo"]])
 def test_lint_package_template(
@@ -158,7 +174,7 @@ def test_lint_package_template(
         additional_test_cases=additional_test_cases,
     )
     pkg_dir = tmp_path / "test-package"
-    exit_status = call("make lint", shell=True, cwd=pkg_dir)
+    exit_status = call(["make", "-j", str(_make_jobs()), "lint"], cwd=pkg_dir)
     assert exit_status == 0
 
 
@@ -372,3 +388,54 @@ def test_package_templater_test_cases(
     p.test_cases = test_cases
 
     assert p.test_cases == expected
+
+
+def test_package_templater_template_commit(tmp_path: Path, config: Config, capsys):
+    p = PackageTemplater(config, "", None, "test-package", output_dir=str(tmp_path))
+    cruft_json = p.target_dir / ".cruft.json"
+
+    assert p.template_commit is None
+    assert "Package doesn't have a `.cruft.json`" in capsys.readouterr().out
+
+    cruft_json.parent.mkdir()
+    with open(cruft_json, "w", encoding="utf-8") as f:
+        json.dump({"commit": "abc1234"}, f)
+    assert p.template_commit == "abc1234"
+
+    # `.cruft.json` is only parsed once
+    with open(cruft_json, "w", encoding="utf-8") as f:
+        json.dump({"commit": "def5678"}, f)
+    assert p.template_commit == "abc1234"
+
+    p._cruft_json_cache = None
+    assert p.template_commit == "def5678"
+
+
+def test_package_templater_update_skips_pinned_up_to_date(
+    tmp_path: Path, config: Config, capsys
+):
+    commit_sha = "0123456789abcdef0123456789abcdef01234567"
+    p = PackageTemplater(
+        config, "", commit_sha, "test-package", output_dir=str(tmp_path)
+    )
+    p.copyright_holder = "VSHN AG <info@vshn.ch>"
+    p.github_owner = "projectsyn"
+    p.golden_tests = True
+    p.target_dir.mkdir()
+    cookiecutter_args = p.cookiecutter_args
+    with open(p.target_dir / ".cruft.json", "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "commit": commit_sha,
+                "checkout": commit_sha,
+                "context": {"cookiecutter": cookiecutter_args},
+            },
+            f,
+        )
+
+    assert not p.update()
+    assert "Package test-package already up-to-date" in capsys.readouterr().out
+
+    p._cruft_json_cache = None
+    p.golden_tests = False
+    assert not p._template_up_to_date(p.cookiecutter_args)
@@ -1,7 +1,9 @@
 """
 Tests for postprocessing
 """
-import os
+import shutil
+
+from pathlib import Path
 
 import click
 import pytest
@@ -17,6 +19,72 @@ from commodore.postprocess import (
     jsonnet as jsonnet_pp,
 )
 from test_component_template import call_component_new
+from conftest import SafeDumper, SafeLoader, make_cli_runner
+
+_SECRET_YAML = yaml.dump(
+    {
+        "metadata": {
+            "name": "test",
+            "namespace": "untouched",
+        },
+        "kind": "Secret",
+        "apiVersion": "v1",
+        "stringData": {
+            "content": "verysecret",
+        },
+    },
+    Dumper=SafeDumper,
+)
+
+_JSONNET_FILTER_BODY = dedent(
+    """
+    local com = import 'lib/commodore.libjsonnet';
+    local inv = com.inventory();
+    local params = inv.parameters.test_component;
+    local file = std.extVar('output_path') + '/object.yaml';
+    local objs = com.yaml_load_all(file);
+    local stem(elem) =
+        local elems = std.split(elem, '.');
+        std.join('.', elems[:std.length(elems) - 1]);
+    local fixup(objs) = [ obj { metadata+: { namespace: params.namespace }} for obj in objs ];
+    {
+        [stem(file)]: fixup(objs),
+    }
+    """
+)
+
+_JSONNET_FILTER_CREATE_NS = dedent(
+    """
+    {
+        "00_namespace": {
+            apiVersion: "v1",
+            kind: "Namespace",
+            metadata: {
+                name: params.namespace,
+            }
+        }
+    }
+    """
+)
+
+_KUBE_LIBJSONNET = dedent(
+    """
+    {
+        Namespace(name): {
+            apiVersion: "v1",
+            kind: "Namespace",
+            metadata: {
+                name: name,
+            },
+        }
+    }"""
+)
+
+_INVENTORY_CLASSES = (
+    "defaults.test-component",
+    "global.common",
+    "components.test-component",
+)
 
 
 def _make_builtin_filter(ns, enabled=None, create_namespace="false"):
@@ -42,45 +110,14 @@ def _make_jsonnet_filter(tmp_path, ns, enabled=None, create_namespace=False):
     filter_file = (
         tmp_path / "dependencies" / "test-component" / "postprocess" / "filter.jsonnet"
     )
-    os.makedirs(filter_file.parent)
+    filter_file.parent.mkdir(parents=True, exist_ok=True)
     assert isinstance(create_namespace, bool)
 
-    create_ns_jsonnet = ""
+    filter_jsonnet = _JSONNET_FILTER_BODY
     if create_namespace:
-        create_ns_jsonnet = dedent(
-            """
-            {
-                "00_namespace": {
-                    apiVersion: "v1",
-                    kind: "Namespace",
-                    metadata: {
-                        name: params.namespace,
-                    }
-                }
-            }
-            """
-        )
+        filter_jsonnet += _JSONNET_FILTER_CREATE_NS
 
-    with open(filter_file, "w") as ff:
-        ff.write(
-            dedent(
-                """
-                local com = import 'lib/commodore.libjsonnet';
-                local inv = com.inventory();
-                local params = inv.parameters.test_component;
-                local file = std.extVar('output_path') + '/object.yaml';
-                local objs = com.yaml_load_all(file);
-                local stem(elem) =
-                    local elems = std.split(elem, '.');
-                    std.join('.', elems[:std.length(elems) - 1]);
-                local fixup(objs) = [ obj { metadata+: { namespace: params.namespace }} for obj in objs ];
-                {
-                    [stem(file)]: fixup(objs),
-                }
-                """
-                + create_ns_jsonnet
-            )
-        )
+    filter_file.write_text(filter_jsonnet, encoding="utf-8")
 
     f = {
         "filters": [
@@ -108,49 +145,51 @@ def _make_ns_filter(
     return _make_builtin_filter(ns, enabled=enabled, create_namespace=create_namespace)
 
 
+@pytest.fixture(scope="session")
+def component_prototype(tmp_path_factory):
+    """
+    Create the test component once per session
+
+    Tests copy the prototype into their working directory with `_new_component()`.
+    """
+    prototype = tmp_path_factory.mktemp("postprocess-component")
+    call_component_new(prototype, make_cli_runner())
+    return prototype
+
+
+def _new_component(tmp_path, prototype):
+    # Commodore creates relative symlinks in the inventory, keep them as symlinks so
+    # they point into the copy. Files are copied rather than hardlinked, so tests can't
+    # modify the prototype by writing to a file in their working directory.
+    shutil.copytree(prototype, tmp_path, symlinks=True, dirs_exist_ok=True)
+    # The component is a worktree of a bare repo in `dependencies/.repos`. The
+    # worktree's `.git` file and the bare repo's `worktrees/<name>/gitdir` file
+    # contain absolute paths, point them at the copy instead of the prototype.
+    for dotgit in (tmp_path / "dependencies").glob("*/.git"):
+        if not dotgit.is_file():
+            continue
+        _, _, gitdir = dotgit.read_text(encoding="utf-8").partition("gitdir: ")
+        wt_gitdir = tmp_path / Path(gitdir.strip()).relative_to(prototype)
+        dotgit.write_text(f"gitdir: {wt_gitdir}\n", encoding="utf-8")
+        (wt_gitdir / "gitdir").write_text(f"{dotgit}\n", encoding="utf-8")
+
+
 def _setup(tmp_path, f, alias="test-component"):
     targetdir = tmp_path / "compiled" / alias / "test"
-    os.makedirs(targetdir, exist_ok=True)
+    targetdir.mkdir(parents=True, exist_ok=True)
 
     libdir = tmp_path / "vendor" / "lib"
-    os.makedirs(libdir, exist_ok=True)
-
-    with open(libdir / "kube.libjsonnet", "w") as kf:
-        kf.write(
-            dedent(
-                """
-                {
-                    Namespace(name): {
-                        apiVersion: "v1",
-                        kind: "Namespace",
-                        metadata: {
-                            name: name,
-                        },
-                    }
-                }"""
-            )
-        )
+    libdir.mkdir(parents=True, exist_ok=True)
+    (libdir / "kube.libjsonnet").write_text(_KUBE_LIBJSONNET, encoding="utf-8")
 
     testf = targetdir / "object.yaml"
-    with open(testf, "w") as objf:
-        obj = {
-            "metadata": {
-                "name": "test",
-                "namespace": "untouched",
-            },
-            "kind": "Secret",
-            "apiVersion": "v1",
-            "stringData": {
-                "content": "verysecret",
-            },
-        }
-        yaml.dump(obj, objf)
+    testf.write_text(_SECRET_YAML, encoding="utf-8")
 
     # Create external pp filter file
     pp_file = (
         tmp_path / "dependencies" / "test-component" / "postprocess" / "filters.yml"
     )
-    os.makedirs(pp_file.parent, exist_ok=True)
+    pp_file.parent.mkdir(parents=True, exist_ok=True)
 
     config = Config(work_dir=tmp_path)
     cdep = MultiDependency("https://fake.repo.url/", tmp_path / "dependencies")
@@ -160,11 +199,7 @@ def _setup(tmp_path, f, alias="test-component"):
     config.register_component_aliases(aliases)
     inventory = {
         alias: {
-            "classes": [
-                "defaults.test-component",
-                "global.common",
-                "components.test-component",
-            ],
+            "classes": list(_INVENTORY_CLASSES),
             "parameters": {
                 "test_component": {
                     "namespace": "myns",
@@ -186,11 +221,8 @@ def _expected_ns(enabled):
         return "untouched"
 
 
-@pytest.mark.parametrize("enabled", [None, True, False])
-@pytest.mark.parametrize("alias", ["test-component", "component-alias"])
-@pytest.mark.parametrize(
-    "jsonnet,create_namespace",
-    [
+def _postprocess_components_cases():
+    filter_variants = [
         (False, False),
         (False, True),
         (False, "false"),
@@ -199,12 +231,41 @@ def _expected_ns(enabled):
         # Jsonnet filter.
         (True, False),
         (True, True),
-    ],
+    ]
+    cases = []
+    for alias in ["test-component", "component-alias"]:
+        for enabled in [None, True]:
+            for jsonnet, create_namespace in filter_variants:
+                cases.append((enabled, alias, jsonnet, create_namespace))
+        # Disabled filters are skipped before their arguments are looked at, so we
+        # only check once per filter type that no namespace is created.
+        for jsonnet in [False, True]:
+            cases.append((False, alias, jsonnet, True))
+
+    return [
+        pytest.param(
+            *case,
+            id="{}-{}-enabled={}-create_namespace={!r}".format(
+                "jsonnet" if case[2] else "builtin", case[1], case[0], case[3]
+            ),
+        )
+        for case in cases
+    ]
+
+
+@pytest.mark.parametrize(
+    "enabled,alias,jsonnet,create_namespace", _postprocess_components_cases()
 )
 def test_postprocess_components(
-    tmp_path, cli_runner, capsys, enabled, jsonnet, alias, create_namespace
+    tmp_path,
+    capsys,
+    component_prototype,
+    enabled,
+    jsonnet,
+    alias,
+    create_namespace,
 ):
-    call_component_new(tmp_path, cli_runner)
+    _new_component(tmp_path, component_prototype)
 
     f = _make_ns_filter(
         tmp_path,
@@ -220,9 +281,13 @@ def test_postprocess_components(
 
     assert testf.exists()
     expected_ns = _expected_ns(enabled)
-    with open(testf) as objf:
-        obj = yaml.safe_load(objf)
-        assert obj["metadata"]["namespace"] == expected_ns
+    if enabled is not None and not enabled:
+        # Disabled filters must leave the object untouched
+        assert testf.read_text(encoding="utf-8") == _SECRET_YAML
+    else:
+        with open(testf) as objf:
+            obj = yaml.load(objf, Loader=SafeLoader)
+            assert obj["metadata"]["namespace"] == expected_ns
 
     create_ns = create_namespace
     if isinstance(create_ns, str):
@@ -236,7 +301,7 @@ def test_postprocess_components(
         assert nsf.exists() == ns_created
         if ns_created:
             with open(nsf) as ns:
-                obj = yaml.safe_load(ns)
+                obj = yaml.load(ns, Loader=SafeLoader)
                 assert obj == {
                     "apiVersion": "v1",
                     "kind": "Namespace",
@@ -274,9 +339,13 @@ def test_postprocess_components(
     ],
 )
 def test_postprocess_invalid_jsonnet_filter(
-    capsys, tmp_path, cli_runner, error: str, expected: str
+    capsys,
+    tmp_path,
+    component_prototype,
+    error: str,
+    expected: str,
 ):
-    call_component_new(tmp_path, cli_runner)
+    _new_component(tmp_path, component_prototype)
 
     f = _make_jsonnet_filter(tmp_path, "override")
     filtername = f["filters"][0]["filter"]
@@ -331,9 +400,14 @@ def test_postprocess_invalid_jsonnet_filter(
     ],
 )
 def test_postprocess_invalid_builtin_filter(
-    capsys, tmp_path, cli_runner, filtername: str, error: str, expected: str
+    capsys,
+    tmp_path,
+    component_prototype,
+    filtername: str,
+    error: str,
+    expected: str,
 ):
-    call_component_new(tmp_path, cli_runner)
+    _new_component(tmp_path, component_prototype)
 
     f = _make_builtin_filter("myns")
     f["filters"][0]["filter"] = filtername
@@ -400,8 +474,7 @@ def test_postprocess_jsonnet_try_path(tmp_path, full_rel):
     if full_rel:
         rel = str((tmp_path / "test.txt").absolute())
 
-    with open(testf, "w") as fh:
-        fh.write("Test")
+    testf.write_text("Test", encoding="utf-8")
 
     path, contents = jsonnet_pp._try_path(tmp_path, rel)
 
@@ -428,8 +501,7 @@ def test_postprocess_jsonnet_try_path_dir(tmp_path, rel, expected):
 def test_postprocess_jsonnet_import_cb(tmp_path, basedir, floc):
     testf = tmp_path / floc / "test.txt"
     testf.parent.mkdir(exist_ok=True, parents=True)
-    with open(testf, "w") as fh:
-        fh.write(f"Test {testf.parent}")
+    testf.write_text(f"Test {testf.parent}", encoding="utf-8")
 
     # Relative basedir doesn't pick up file in basedir/rel, so we pass the absolute
     # basedir.
@@ -2,7 +2,6 @@
 Unit-tests for target generation
 """
 
-import os
 import click
 import pytest
 
@@ -13,6 +12,20 @@ from commodore import cluster, __kustomize_wrapper__
 from commodore.inventory import Inventory
 from commodore.config import Config
 
+_CLUSTER_PARAMS_YAML = dedent(
+    """
+    parameters:
+      cluster:
+        name: c-twilight-water-9032
+        tenant: t-delicate-pine-3938"""
+)
+
+_EMPTY_PARAMS_YAML = dedent(
+    """
+    classes: []
+    parameters: {}"""
+)
+
 
 class MockComponent:
     def __init__(self, base_dir: P, name: str):
@@ -28,19 +41,21 @@ def cluster_from_data(apidata) -> cluster.Cluster:
     return cluster.Cluster(apidata["cluster"], apidata["tenant"])
 
 
+@pytest.fixture
+def inv(tmp_path: P) -> Inventory:
+    return Inventory(work_dir=tmp_path)
+
+
 def _setup_working_dir(inv: Inventory, components):
+    inv.defaults_dir.mkdir(parents=True, exist_ok=True)
+    inv.components_dir.mkdir(parents=True, exist_ok=True)
     for cls in components:
-        defaults = inv.defaults_file(cls)
-        os.makedirs(defaults.parent, exist_ok=True)
-        defaults.touch()
-        component = inv.component_file(cls)
-        os.makedirs(component.parent, exist_ok=True)
-        component.touch()
+        inv.defaults_file(cls).touch()
+        inv.component_file(cls).touch()
 
 
-def test_render_bootstrap_target(tmp_path: P):
+def test_render_bootstrap_target(tmp_path: P, inv: Inventory):
     components = ["foo", "bar"]
-    inv = Inventory(work_dir=tmp_path)
     _setup_working_dir(inv, components)
 
     components = {
@@ -58,19 +73,14 @@ def test_render_bootstrap_target(tmp_path: P):
         "global.commodore",
     ]
     assert target != ""
-    assert len(target["classes"]) == len(
-        classes
-    ), "rendered target includes different amount of classes"
-    for i in range(len(classes)):
-        assert target["classes"][i] == classes[i]
+    assert target["classes"] == classes
     assert target["parameters"]["_instance"] == "cluster"
     assert "_base_directory" not in target["parameters"]
     assert "_kustomize_wrapper" not in target["parameters"]
 
 
-def test_render_target(tmp_path: P):
+def test_render_target(tmp_path: P, inv: Inventory):
     components = ["foo", "bar"]
-    inv = Inventory(work_dir=tmp_path)
     _setup_working_dir(inv, components)
 
     components = {
@@ -89,20 +99,15 @@ def test_render_target(tmp_path: P):
         "components.foo",
     ]
     assert target != ""
-    assert len(target["classes"]) == len(
-        classes
-    ), "rendered target includes different amount of classes"
-    for i in range(len(classes)):
-        assert target["classes"][i] == classes[i]
+    assert target["classes"] == classes
     assert target["parameters"]["kapitan"]["vars"]["target"] == "foo"
     assert target["parameters"]["_instance"] == "foo"
     assert target["parameters"]["_base_directory"] == str(tmp_path / "foo")
     assert target["parameters"]["_kustomize_wrapper"] == str(__kustomize_wrapper__)
 
 
-def test_render_aliased_target(tmp_path: P):
+def test_render_aliased_target(tmp_path: P, inv: Inventory):
     components = ["foo", "bar"]
-    inv = Inventory(work_dir=tmp_path)
     _setup_working_dir(inv, components)
 
     components = {
@@ -122,20 +127,15 @@ def test_render_aliased_target(tmp_path: P):
     ]
     assert target != ""
     print(target)
-    assert len(target["classes"]) == len(
-        classes
-    ), "rendered target includes different amount of classes"
-    for i in range(len(classes)):
-        assert target["classes"][i] == classes[i]
+    assert target["classes"] == classes
     assert target["parameters"]["kapitan"]["vars"]["target"] == "fooer"
     assert target["parameters"]["foo"] == "${fooer}"
     assert target["parameters"]["_instance"] == "fooer"
     assert target["parameters"]["_base_directory"] == str(tmp_path / "foo")
 
 
-def test_render_aliased_target_with_dash(tmp_path: P):
+def test_render_aliased_target_with_dash(tmp_path: P, inv: Inventory):
     components = ["foo-comp", "bar"]
-    inv = Inventory(work_dir=tmp_path)
     _setup_working_dir(inv, components)
 
     components = {
@@ -155,21 +155,16 @@ def test_render_aliased_target_with_dash(tmp_path: P):
     ]
     assert target != ""
     print(target)
-    assert len(target["classes"]) == len(
-        classes
-    ), "rendered target includes different amount of classes"
-    for i in range(len(classes)):
-        assert target["classes"][i] == classes[i]
+    assert target["classes"] == classes
     assert target["parameters"]["kapitan"]["vars"]["target"] == "foo-1"
     assert target["parameters"]["foo_comp"] == "${foo_1}"
     assert target["parameters"]["_instance"] == "foo-1"
     assert target["parameters"]["_base_directory"] == str(tmp_path / "foo-comp")
 
 
-def test_render_params(api_data, tmp_path: P):
-    cfg = Config(work_dir=tmp_path)
-    target = cfg.inventory.bootstrap_target
-    params = cluster.render_params(cfg.inventory, cluster_from_data(api_data))
+def test_render_params(api_data, config: Config):
+    target = config.inventory.bootstrap_target
+    params = cluster.render_params(config.inventory, cluster_from_data(api_data))
 
     assert "parameters" in params
 
@@ -211,52 +206,32 @@ def test_render_params(api_data, tmp_path: P):
     assert "v1.21.3" == k8s_ver["gitVersion"]
 
 
-def test_missing_facts(api_data, tmp_path: P):
+def test_missing_facts(api_data, config: Config):
     api_data["cluster"]["facts"].pop("cloud")
-    cfg = Config(work_dir=tmp_path)
     with pytest.raises(click.ClickException):
-        cluster.render_params(cfg.inventory, cluster_from_data(api_data))
+        cluster.render_params(config.inventory, cluster_from_data(api_data))
 
 
-def test_empty_facts(api_data, tmp_path: P):
+def test_empty_facts(api_data, config: Config):
     api_data["cluster"]["facts"]["cloud"] = ""
-    cfg = Config(work_dir=tmp_path)
     with pytest.raises(click.ClickException):
-        cluster.render_params(cfg.inventory, cluster_from_data(api_data))
-
-
-def test_read_cluster_and_tenant(tmp_path):
-    cfg = Config(work_dir=tmp_path)
-    file = cfg.inventory.params_file
-    os.makedirs(file.parent, exist_ok=True)
-    with open(file, "w") as f:
-        f.write(
-            dedent(
-                """
-            parameters:
-              cluster:
-                name: c-twilight-water-9032
-                tenant: t-delicate-pine-3938"""
-            )
-        )
-
-    cluster_id, tenant_id = cluster.read_cluster_and_tenant(cfg.inventory)
+        cluster.render_params(config.inventory, cluster_from_data(api_data))
+
+
+def test_read_cluster_and_tenant(config: Config):
+    file = config.inventory.params_file
+    file.parent.mkdir(parents=True, exist_ok=True)
+    file.write_text(_CLUSTER_PARAMS_YAML, encoding="utf-8")
+
+    cluster_id, tenant_id = cluster.read_cluster_and_tenant(config.inventory)
     assert cluster_id == "c-twilight-water-9032"
     assert tenant_id == "t-delicate-pine-3938"
 
 
-def test_read_cluster_and_tenant_missing_fact(tmp_path):
-    inv = Inventory(work_dir=tmp_path)
+def test_read_cluster_and_tenant_missing_fact(inv: Inventory):
     file = inv.params_file
-    os.makedirs(file.parent, exist_ok=True)
-    with open(file, "w") as f:
-        f.write(
-            dedent(
-                """
-            classes: []
-            parameters: {}"""
-            )
-        )
+    file.parent.mkdir(parents=True, exist_ok=True)
+    file.write_text(_EMPTY_PARAMS_YAML, encoding="utf-8")
 
     with pytest.raises(KeyError):
         cluster.read_cluster_and_tenant(inv)
@@ -2,11 +2,25 @@
 Unit-tests for tokencache
 """
 import json
+import os
+
+import jwt
+import pytest
 
 from xdg.BaseDirectory import xdg_cache_home
 from commodore import tokencache
 
 
+@pytest.fixture(autouse=True)
+def reset_tokencache():
+    """Reset the in-memory token cache and the cached JWT claims for each test"""
+    tokencache._cache = None
+    tokencache._decode_claims.cache_clear()
+    yield
+    tokencache._cache = None
+    tokencache._decode_claims.cache_clear()
+
+
 def test_get_token(fs):
     fs.create_file(
         f"{xdg_cache_home}/commodore/token",
@@ -68,18 +82,71 @@ def test_drop_old_cache_entry(fs):
 
 
 def test_update_broken_json_cache(fs):
-    cachef = fs.create_file(
+    fs.create_file(
         f"{xdg_cache_home}/commodore/token",
         contents='{"https://syn.example.com":{"id_token":"token"}',
     )
     tokencache.save("https://syn2.example.com", {"id_token": "token2"})
     assert tokencache.get("https://syn2.example.com") == {"id_token": "token2"}
-    assert (
-        cachef.contents
-        == '{\n "https://syn2.example.com": {\n  "id_token": "token2"\n }\n}'
-    )
+    with open(f"{xdg_cache_home}/commodore/token") as f:
+        assert json.load(f) == {"https://syn2.example.com": {"id_token": "token2"}}
 
     tokencache.save("https://syn.example.com", {"id_token": "token"})
 
     assert tokencache.get("https://syn2.example.com") == {"id_token": "token2"}
     assert tokencache.get("https://syn.example.com") == {"id_token": "token"}
+
+
+def test_get_token_reloads_modified_cache(fs):
+    tokencache.save("https://syn.example.com", {"id_token": "token"})
+    assert tokencache.get("https://syn.example.com") == {"id_token": "token"}
+
+    with open(f"{xdg_cache_home}/commodore/token", "w") as f:
+        json.dump({"https://syn.example.com": {"id_token": "updated-token"}}, f)
+
+    assert tokencache.get("https://syn.example.com") == {"id_token": "updated-token"}
+
+
+def test_get_token_returns_copy(fs):
+    tokencache.save("https://syn.example.com", {"id_token": "token"})
+
+    token = tokencache.get("https://syn.example.com")
+    token["id_token"] = "modified"
+
+    assert tokencache.get("https://syn.example.com") == {"id_token": "token"}
+
+
+def test_save_token_removes_tempfile_on_error(fs, monkeypatch):
+    tokencache.save("https://syn.example.com", {"id_token": "token"})
+
+    def _fail_replace(src, dst):
+        raise OSError("replace failed")
+
+    monkeypatch.setattr(tokencache.os, "replace", _fail_replace)
+    with pytest.raises(OSError, match="replace failed"):
+        tokencache.save("https://syn2.example.com", {"id_token": "token2"})
+
+    assert os.listdir(f"{xdg_cache_home}/commodore") == ["token"]
+    assert tokencache.get("https://syn.example.com") == {"id_token": "token"}
+    assert tokencache.get("https://syn2.example.com") == {}
+
+
+def test_peek_claims():
+    token = jwt.encode({"sub": "commodore", "exp": 0}, "secret", algorithm="HS256")
+
+    assert tokencache.peek_claims(token) == {"sub": "commodore", "exp": 0}
+    assert tokencache.peek_claims(token) == {"sub": "commodore", "exp": 0}
+    assert tokencache._decode_claims.cache_info().hits == 1
+
+
+def test_peek_claims_returns_copy():
+    token = jwt.encode({"sub": "commodore", "exp": 0}, "secret", algorithm="HS256")
+
+    claims = tokencache.peek_claims(token)
+    claims["exp"] = 1
+
+    assert tokencache.peek_claims(token) == {"sub": "commodore", "exp": 0}
+
+
+def test_peek_claims_invalid_token():
+    assert tokencache.peek_claims("not-a-jwt") is None